@@ -1,16 +1,47 @@
 # Copyright (c) 2025 DFlexy · https://github.com/DFlexy
 
+import json
 import logging
 import time
 from typing import Any, Dict, List, Optional, Tuple
 
-from flask import Request
+from flask import Request, Response
+from flask.json.provider import DefaultJSONProvider
 
 from app.config import Config
+from cache import json_codec
 from core.processors.torrent_processor import TorrentProcessor
 
 logger = logging.getLogger(__name__)
 
+_JSON_MIMETYPE = 'application/json'
+
+_orjson = json_codec.orjson
+_RESPONSE_OPTIONS = (
+    _orjson.OPT_SORT_KEYS | _orjson.OPT_PASSTHROUGH_DATETIME | _orjson.OPT_PASSTHROUGH_DATACLASS
+    if _orjson is not None else 0
+)
+
+def _dumps_response(data: Any) -> bytes:
+    """Mesmo contrato do jsonify: chaves ordenadas, tipos extras via DefaultJSONProvider.default
+    (datetime, Decimal, UUID, dataclass) e TypeError para o resto.
+
+    Única diferença: o orjson grava não-ASCII como UTF-8 em vez de escapes \\uXXXX (mesmo JSON decodificado).
+    """
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(data, default=DefaultJSONProvider.default, option=_RESPONSE_OPTIONS)
+        except _orjson.JSONEncodeError:
+            # int > 64 bits e afins: o json padrão aceita; tipo desconhecido levanta TypeError lá também
+            pass
+    return json.dumps(
+        data, default=DefaultJSONProvider.default, sort_keys=True, separators=(',', ':'),
+    ).encode('utf-8')
+
+def make_json_response(data: Any, status_code: int = 200) -> Response:
+    """Resposta JSON serializada direto em bytes (orjson), com a mesma saída do jsonify."""
+    return Response(_dumps_response(data) + b'\n', status=status_code, mimetype=_JSON_MIMETYPE)
+
 def format_log_flag(value: bool) -> str:
     return 'ON' if value else 'OFF'
 
@@ -3,7 +3,7 @@
 import logging
 from datetime import datetime
 
-from flask import jsonify, request
+from flask import request
 
 from api.handler_helpers import (
     combine_all_scrapers_stats,
@@ -12,6 +12,7 @@ from api.handler_helpers import (
     get_indexed_torrents_count,
     log_filter_stats,
     log_response_diagnostics,
+    make_json_response,
     parse_request_params,
     sort_torrents_by_date,
     validate_torrent_results,
@@ -57,7 +58,7 @@ def index_handler():
         },
     }
 
-    return jsonify({
+    return make_json_response({
         'time': datetime.now().strftime('%A, %d-%b-%y %H:%M:%S UTC'),
         'build': 'Python Torrent Indexer v1.0.0',
         'endpoints': endpoints,
@@ -196,15 +197,15 @@ def indexer_handler(site_name: str = None):
             if not is_valid:
                 if is_removed_legacy_id(site_name):
                     logger.warning('Tentativa de usar scraper ID removido: %s', site_name)
-                    return jsonify({'results': [], 'count': 0}), 200
-                return jsonify({
+                    return make_json_response({'results': [], 'count': 0})
+                return make_json_response({
                     'error': (
                         f'Scraper "{site_name}" não configurado. '
                         f'Tipos disponíveis: {available_types}'
                     ),
                     'results': [],
                     'count': 0,
-                }), 404
+                }, 404)
 
             display_label = types_info[normalized_type].get('display_name', site_name)
             log_prefix = f'[{display_label}]'
@@ -238,21 +239,22 @@ def indexer_handler(site_name: str = None):
         if is_prowlarr_test:
             response_data['teste'] = True
 
-        return jsonify(response_data)
+        # Serializa dentro do try: erro de serialização vira o 500 JSON abaixo, não um 200 truncado
+        return make_json_response(response_data)
 
     except ValueError as e:
         site_info = f'[{display_label}]' if display_label != 'UNKNOWN' else '[UNKNOWN]'
         error_msg = str(e).split('\n')[0][:100] if str(e) else str(e)
         logger.warning('%s Validation error: %s', site_info, error_msg)
-        return jsonify({'error': str(e), 'results': [], 'count': 0}), 400
+        return make_json_response({'error': str(e), 'results': [], 'count': 0}, 400)
     except KeyError as e:
         site_info = f'[{display_label}]' if display_label != 'UNKNOWN' else '[UNKNOWN]'
         error_msg = str(e).split('\n')[0][:100] if str(e) else str(e)
         logger.error('%s Configuration error: %s', site_info, error_msg, exc_info=True)
-        return jsonify({'error': 'Configuration error', 'results': [], 'count': 0}), 500
+        return make_json_response({'error': 'Configuration error', 'results': [], 'count': 0}, 500)
     except Exception as e:
         site_info = f'[{display_label}]' if display_label != 'UNKNOWN' else '[UNKNOWN]'
         error_type = type(e).__name__
         error_msg = str(e).split('\n')[0][:100] if str(e) else str(e)
         logger.error('%s Unexpected error: %s - %s', site_info, error_type, error_msg, exc_info=True)
-        return jsonify({'error': 'Internal server error', 'results': [], 'count': 0}), 500
+        return make_json_response({'error': 'Internal server error', 'results': [], 'count': 0}, 500)
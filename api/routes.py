@@ -1,19 +1,26 @@
 # Copyright (c) 2025 DFlexy · https://github.com/DFlexy
 
-from flask import Flask, render_template, make_response
+from flask import Flask, current_app, make_response, render_template
 from api.handlers import index_handler, indexer_handler
 
+_SEARCH_PAGE_HEADERS = {
+    'Content-Type': 'text/html; charset=utf-8',
+    'Cache-Control': 'no-cache, no-store, must-revalidate, max-age=0',
+    'Pragma': 'no-cache',
+    'Expires': '0',
+    'X-Content-Type-Options': 'nosniff',
+}
+
 def register_routes(app: Flask):
+    # search.html não depende da requisição: renderiza uma única vez no startup,
+    # via render_template (com os context processors do Flask)
+    with app.test_request_context():
+        app.extensions['search_page'] = render_template('search.html').encode('utf-8')
+
     app.add_url_rule('/', 'index', index_handler, methods=['GET'])
     app.add_url_rule('/indexer', 'indexer', lambda: indexer_handler(None), methods=['GET'])
     app.add_url_rule('/indexers/<site_name>', 'indexer_by_site', indexer_handler, methods=['GET'])
     app.add_url_rule('/api', 'search_page', search_page_handler, methods=['GET'])
 
 def search_page_handler():
-    response = make_response(render_template('search.html'))
-    response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate, max-age=0'
-    response.headers['Pragma'] = 'no-cache'
-    response.headers['Expires'] = '0'
-    response.headers['X-Content-Type-Options'] = 'nosniff'
-    return response
-
+    return make_response(current_app.extensions['search_page'], 200, _SEARCH_PAGE_HEADERS)
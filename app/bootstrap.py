@@ -32,10 +32,12 @@ class Bootstrap:
             try:
                 redis_client.ping()
                 logger.info("[[ Redis Conectado ]]")
+                from cache.html_bloom import warm_html_bloom_async
+                warm_html_bloom_async(redis_client)
             except Exception:
                 logger.warning("[[ Redis Não Conectado ]]")
         else:
-            if Config.REDIS_HOST and Config.REDIS_HOST.strip():
+            if (Config.REDIS_HOST and Config.REDIS_HOST.strip()) or Config.REDIS_SOCKET:
                 logger.warning("[[ Redis Não Conectado ]]")
             else:
                 logger.warning("[[ Redis Não Conectado ]] - REDIS_HOST não configurado")
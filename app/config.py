@@ -20,10 +20,14 @@ def _parse_duration(duration_str: str) -> int:
 class Config:
     PORT: int = int(os.getenv('PORT', '7006'))
     METRICS_PORT: int = int(os.getenv('METRICS_PORT', '8081'))
+    WAITRESS_THREADS: int = 12
     
     REDIS_HOST: Optional[str] = os.getenv('REDIS_HOST', None)
     REDIS_PORT: int = int(os.getenv('REDIS_PORT', '6379'))
     REDIS_DB: int = int(os.getenv('REDIS_DB', '0'))
+    REDIS_SOCKET: Optional[str] = os.getenv('REDIS_SOCKET', None)
+    REDIS_MAX_CONNECTIONS: int = max(1, int(os.getenv('REDIS_MAX_CONNECTIONS', str(max(64, (os.cpu_count() or 1) * 4)))))
+    REDIS_POOL_TIMEOUT: float = float(os.getenv('REDIS_POOL_TIMEOUT', '2'))
     
     HTML_CACHE_TTL_SHORT: int = _parse_duration(
         os.getenv('HTML_CACHE_TTL_SHORT', '10m')
@@ -31,6 +35,11 @@ class Config:
     HTML_CACHE_TTL_LONG: int = _parse_duration(
         os.getenv('HTML_CACHE_TTL_LONG', '12h')
     )
+    # Bloom filter em memória das URLs com HTML no Redis (evita GET em miss certo).
+    # Só ligar com uma única instância por Redis: HTML gravado por outra instância vira miss.
+    HTML_CACHE_BLOOM_ENABLED: bool = os.getenv('HTML_CACHE_BLOOM_ENABLED', 'false').lower() == 'true'
+    HTML_CACHE_BLOOM_CAPACITY: int = int(os.getenv('HTML_CACHE_BLOOM_CAPACITY', '100000'))
+    HTML_CACHE_BLOOM_REBUILD_INTERVAL: int = _parse_duration(os.getenv('HTML_CACHE_BLOOM_REBUILD_INTERVAL', '30m'))
     FLARESOLVERR_SESSION_TTL: int = _parse_duration(
         os.getenv('FLARESOLVERR_SESSION_TTL', '8h')
     )
@@ -71,6 +80,9 @@ class Config:
     RESOLVED_LINK_CACHE_TTL: int = _parse_duration(os.getenv('RESOLVED_LINK_CACHE_TTL', '7d'))
     CROSS_DATA_TTL_WITH_TRACKER: int = _parse_duration(os.getenv('CROSS_DATA_TTL_WITH_TRACKER', '24h'))
     CROSS_DATA_TTL_DEFAULT: int = _parse_duration(os.getenv('CROSS_DATA_TTL_DEFAULT', '30d'))
+    # Cache em memória de get_cross_data_from_redis (0 desliga)
+    CROSS_DATA_LOCAL_CACHE_TTL: int = _parse_duration(os.getenv('CROSS_DATA_LOCAL_CACHE_TTL', '30s'))
+    CROSS_DATA_LOCAL_CACHE_SIZE: int = int(os.getenv('CROSS_DATA_LOCAL_CACHE_SIZE', '10000'))
     
     HTTP_RETRY_MAX_ATTEMPTS: int = int(os.getenv('HTTP_RETRY_MAX_ATTEMPTS', '3'))
     HTTP_RETRY_BACKOFF_BASE: float = float(os.getenv('HTTP_RETRY_BACKOFF_BASE', '1.0'))
@@ -27,7 +27,7 @@ if __name__ == '__main__':
         app,
         host='0.0.0.0',
         port=Config.PORT,
-        threads=12,
+        threads=Config.WAITRESS_THREADS,
         channel_timeout=300,
         recv_bytes=65536,
     )
@@ -0,0 +1,127 @@
+# Copyright (c) 2025 DFlexy · https://github.com/DFlexy
+
+import logging
+import math
+import threading
+import time
+from typing import List, Optional
+
+from app.config import Config
+from cache.redis_keys import url_hash
+
+logger = logging.getLogger(__name__)
+
+class HTMLCacheBloomFilter:
+    """Bloom filter das URLs com HTML no Redis: responde 'com certeza não está' sem round-trip.
+
+    Enquanto não foi aquecido a partir do Redis (SCAN), ou depois de passar da capacidade,
+    responde sempre 'talvez'.
+    """
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 0.01):
+        self.capacity = capacity
+        self.count = 0
+        self.num_bits = max(8, int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        self.num_hashes = max(1, int(round(self.num_bits / capacity * math.log(2))))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self._lock = threading.Lock()
+        self.ready = False
+
+    def _positions(self, digest: str):
+        # Double hashing sobre o md5 já usado nas chaves html:long/html:short
+        h1 = int(digest[:16], 16)
+        h2 = int(digest[16:], 16) | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add_hash(self, digest: str) -> None:
+        with self._lock:
+            is_new = False
+            for pos in self._positions(digest):
+                mask = 1 << (pos & 7)
+                if not self._bits[pos >> 3] & mask:
+                    self._bits[pos >> 3] |= mask
+                    is_new = True
+            # Regravar a mesma URL não conta para a capacidade
+            if is_new:
+                self.count += 1
+            if self.count > self.capacity:
+                # Acima da capacidade a taxa de falso positivo dispara: volta a 'talvez' até o rebuild
+                self.ready = False
+
+    def add(self, url: str) -> None:
+        digest = url_hash(url)
+        self.add_hash(digest)
+        # Filtro em reconstrução também recebe o que for gravado durante o SCAN
+        pending = _html_bloom_next
+        if pending is not None and pending is not self:
+            pending.add_hash(digest)
+
+    def might_contain(self, url: str) -> bool:
+        if not self.ready:
+            return True
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(url_hash(url)))
+
+_html_bloom: Optional[HTMLCacheBloomFilter] = None
+_html_bloom_next: Optional[HTMLCacheBloomFilter] = None
+_html_bloom_lock = threading.Lock()
+
+def get_html_bloom() -> HTMLCacheBloomFilter:
+    global _html_bloom
+
+    if _html_bloom is None:
+        with _html_bloom_lock:
+            if _html_bloom is None:
+                _html_bloom = HTMLCacheBloomFilter(capacity=Config.HTML_CACHE_BLOOM_CAPACITY)
+
+    return _html_bloom
+
+def _scan_html_hashes(redis) -> List[str]:
+    hashes: List[str] = []
+    for pattern in ('html:long:*', 'html:short:*'):
+        cursor = 0
+        while True:
+            cursor, keys = redis.scan(cursor, match=pattern, count=1000)
+            for key in keys:
+                if isinstance(key, bytes):
+                    key = key.decode('utf-8', errors='ignore')
+                hashes.append(key.rsplit(':', 1)[-1])
+            if cursor == 0:
+                break
+    return hashes
+
+def rebuild_html_bloom(redis) -> None:
+    """Reconstrói o filtro a partir do SCAN do Redis e troca o global.
+
+    Descarta URLs cujo HTML já expirou e redimensiona para o dobro das chaves encontradas.
+    """
+    global _html_bloom, _html_bloom_next
+    if not redis:
+        return
+    try:
+        hashes = _scan_html_hashes(redis)
+        capacity = max(Config.HTML_CACHE_BLOOM_CAPACITY, len(hashes) * 2)
+        bloom = HTMLCacheBloomFilter(capacity=capacity)
+        _html_bloom_next = bloom
+        for digest in hashes:
+            bloom.add_hash(digest)
+        bloom.ready = True
+        with _html_bloom_lock:
+            _html_bloom = bloom
+        logger.debug("[HTMLCacheBloom] Reconstruído com %d chaves (capacidade %d)", len(hashes), capacity)
+    except Exception as e:
+        logger.debug("[HTMLCacheBloom] Falha ao reconstruir: %s", type(e).__name__)
+    finally:
+        _html_bloom_next = None
+
+def _rebuild_loop(redis) -> None:
+    while True:
+        rebuild_html_bloom(redis)
+        time.sleep(Config.HTML_CACHE_BLOOM_REBUILD_INTERVAL)
+
+def warm_html_bloom_async(redis) -> None:
+    """Aquece o filtro em thread daemon (sem atrasar o startup) e o reconstrói periodicamente."""
+    if not Config.HTML_CACHE_BLOOM_ENABLED or not redis:
+        return
+    threading.Thread(target=_rebuild_loop, args=(redis,), name='html-bloom-rebuild', daemon=True).start()
@@ -2,15 +2,16 @@
 
 import threading
 import time
+from collections import OrderedDict
 from typing import Optional, Dict, Any
 from app.config import Config
 
 class HTTPLocalCache:
-    """Cache local thread-safe em memória para requisições HTTP"""
+    """Cache local thread-safe em memória para requisições HTTP (LRU com TTL)"""
     
     def __init__(self, ttl: Optional[int] = None, max_size: int = 200):
         """Args:"""
-        self._cache: Dict[str, Dict[str, Any]] = {}
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
         self._lock = threading.Lock()
         self.ttl = ttl if ttl is not None else (Config.LOCAL_CACHE_TTL if hasattr(Config, 'LOCAL_CACHE_TTL') else 30)
         self.max_size = max_size
@@ -23,18 +24,16 @@ class HTTPLocalCache:
             return None
         
         with self._lock:
-            if key not in self._cache:
+            entry = self._cache.get(key)
+            if entry is None:
                 return None
             
-            entry = self._cache[key]
-            now = time.time()
-            
-            if now > entry['expires_at']:
+            if time.time() > entry['expires_at']:
                 del self._cache[key]
                 return None
             
+            self._cache.move_to_end(key)
             entry['hits'] += 1
-            entry['last_access'] = now
             return entry['value']
     
     def set(self, key: str, value: bytes) -> None:
@@ -49,18 +48,16 @@ class HTTPLocalCache:
                 self._cleanup_expired(now)
                 self._last_cleanup = now
             
-            if len(self._cache) >= self.max_size:
-                self._cleanup_expired(now)
-                if len(self._cache) >= self.max_size:
-                    self._evict_oldest()
-            
             self._cache[key] = {
                 'value': value,
                 'expires_at': now + self.ttl,
-                'created_at': now,
-                'last_access': now,
                 'hits': 0
             }
+            self._cache.move_to_end(key)
+            
+            # Ordem do OrderedDict = ordem de uso: o primeiro é o menos recente
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
     
     def _cleanup_expired(self, now: float) -> None:
         expired_keys = [
@@ -70,18 +67,6 @@ class HTTPLocalCache:
         for key in expired_keys:
             del self._cache[key]
     
-    def _evict_oldest(self) -> None:
-        if not self._cache:
-            return
-        
-        to_remove = max(1, len(self._cache) // 4)
-        sorted_keys = sorted(
-            self._cache.keys(),
-            key=lambda k: self._cache[k]['last_access']
-        )
-        for key in sorted_keys[:to_remove]:
-            del self._cache[key]
-    
     def delete(self, key: str) -> None:
         """Remove uma entrada específica do cache."""
         with self._lock:
@@ -0,0 +1,29 @@
+# Copyright (c) 2025 DFlexy · https://github.com/DFlexy
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+JSONDecodeError = json.JSONDecodeError
+
+def dumps(obj: Any) -> bytes:
+    """Serializa para JSON compacto em bytes (orjson quando disponível)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NAIVE_UTC)
+        except TypeError:
+            # Tipos fora do suporte do orjson (ex.: int > 64 bits) caem no json padrão
+            pass
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False, default=str).encode('utf-8')
+
+def loads(data: Any) -> Any:
+    """Desserializa JSON de bytes/str (orjson quando disponível)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        data = bytes(data).decode('utf-8')
+    return json.loads(data)
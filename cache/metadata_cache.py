@@ -1,10 +1,10 @@
 # Copyright (c) 2025 DFlexy · https://github.com/DFlexy
 
 import logging
-import json
 import time
 import threading
 from typing import Optional, Dict, Any
+from cache import json_codec
 from cache.redis_client import get_redis_client
 from cache.redis_keys import metadata_key, metadata_failure_key, metadata_failure503_key
 from app.config import Config
@@ -25,13 +25,13 @@ class MetadataCache:
                 key = metadata_key(info_hash_lower)
                 data_str = self.redis.get(key)
                 if data_str:
-                    data = json.loads(data_str.decode('utf-8'))
+                    data = json_codec.loads(data_str)
                     return data
-            except json.JSONDecodeError as e:
+            except json_codec.JSONDecodeError as e:
                 logger.warning(f"[MetadataCache] Erro ao decodificar JSON: {info_hash_lower[:16]}... (chave: {key}) - {e}")
                 return None
             except Exception as e:
-                logger.debug(f"[MetadataCache] Erro ao ler Redis: {type(e).__name__} - {info_hash_lower[:16]}... - {e}")
+                logger.debug("[MetadataCache] Erro ao ler Redis: %s - %.16s... - %s", type(e).__name__, info_hash_lower, e)
                 return None
         
         if not self.redis:
@@ -49,11 +49,11 @@ class MetadataCache:
             try:
                 key = metadata_key(info_hash_lower)
                 exists = self.redis.exists(key)
-                metadata_json = json.dumps(metadata, separators=(',', ':'))
+                metadata_json = json_codec.dumps(metadata)
                 self.redis.setex(key, Config.METADATA_CACHE_TTL, metadata_json)
                 return
             except Exception as e:
-                logger.debug(f"[MetadataCache] Erro ao salvar Redis: {type(e).__name__} - {info_hash_lower[:16]}...")
+                logger.debug("[MetadataCache] Erro ao salvar Redis: %s - %.16s...", type(e).__name__, info_hash_lower)
                 return
         
         if not self.redis:
@@ -88,12 +88,8 @@ class MetadataCache:
         
         if self.redis:
             try:
-                failure503_key = metadata_failure503_key(info_hash_lower)
-                if self.redis.exists(failure503_key):
-                    return True
-                
-                failure_key = metadata_failure_key(info_hash_lower)
-                if self.redis.exists(failure_key):
+                # EXISTS com as duas chaves: um round-trip em vez de dois
+                if self.redis.exists(metadata_failure503_key(info_hash_lower), metadata_failure_key(info_hash_lower)):
                     return True
             except Exception:
                 return False
@@ -1,6 +1,7 @@
 # Copyright (c) 2025 DFlexy · https://github.com/DFlexy
 
 import logging
+import os
 import time
 from typing import Optional, TYPE_CHECKING
 
@@ -26,21 +27,41 @@ def init_redis():
         _redis_client = None
         return
     
-    if not Config.REDIS_HOST or Config.REDIS_HOST.strip() == '':
+    socket_path = (Config.REDIS_SOCKET or '').strip()
+    if not socket_path and (not Config.REDIS_HOST or Config.REDIS_HOST.strip() == ''):
         _redis_client = None
         return
     
+    if socket_path:
+        # Redis local via Unix socket: sem pilha TCP (requer `unixsocket` no redis.conf)
+        address = {'connection_class': redis.UnixDomainSocketConnection, 'path': socket_path}
+    else:
+        address = {'host': Config.REDIS_HOST, 'port': Config.REDIS_PORT, 'socket_keepalive': True}
+    
     try:
-        _redis_client = redis.Redis(
-            host=Config.REDIS_HOST,
-            port=Config.REDIS_PORT,
+        # Pool bloqueante dimensionado: threads do waitress, trackers e metadata
+        # compartilham as conexões e esperam por uma livre em vez de abrir novas sem limite
+        pool = redis.BlockingConnectionPool(
+            **address,
             db=Config.REDIS_DB,
             decode_responses=False,
+            # CLIENT SETNAME em cada conexão do pool: identifica o processo no CLIENT LIST
+            client_name=f'dfindexer-{os.getpid()}',
             socket_connect_timeout=2,
-            socket_timeout=2
+            socket_timeout=2,
+            health_check_interval=30,
+            max_connections=Config.REDIS_MAX_CONNECTIONS,
+            timeout=Config.REDIS_POOL_TIMEOUT,
         )
+        _redis_client = redis.Redis(connection_pool=pool)
         _redis_client.ping()
         _last_warning_log = 0.0
+        logger.debug("[Redis] Pool com até %d conexões", pool.max_connections)
+        if pool.max_connections < Config.WAITRESS_THREADS:
+            logger.warning(
+                "[Redis] REDIS_MAX_CONNECTIONS=%d menor que as %d threads do waitress; requisições vão esperar por conexão livre",
+                pool.max_connections, Config.WAITRESS_THREADS,
+            )
     except Exception as e:
         _redis_client = None
         pass
@@ -1,10 +1,10 @@
 # Copyright (c) 2025 DFlexy · https://github.com/DFlexy
 
 import logging
-import json
 import time
 import threading
 from typing import Optional, Dict, Any
+from cache import json_codec
 from cache.redis_client import get_redis_client
 from cache.redis_keys import tracker_key
 from app.config import Config
@@ -25,10 +25,10 @@ class TrackerCache:
                 key = tracker_key(info_hash_lower)
                 peers_str = self.redis.hget(key, 'peers')
                 if peers_str:
-                    data = json.loads(peers_str.decode('utf-8'))
+                    data = json_codec.loads(peers_str)
                     return data
             except Exception as e:
-                logger.debug(f"[TrackerCache] Erro ao buscar cache Redis: {type(e).__name__}")
+                logger.debug("[TrackerCache] Erro ao buscar cache Redis: %s", type(e).__name__)
                 return None
         
         if not self.redis:
@@ -46,13 +46,13 @@ class TrackerCache:
         if self.redis:
             try:
                 key = tracker_key(info_hash_lower)
-                self.redis.hset(key, 'peers', json.dumps(tracker_data, separators=(',', ':')))
+                self.redis.hset(key, 'peers', json_codec.dumps(tracker_data))
                 self.redis.hset(key, 'last_scrape', str(int(time.time())))
                 self.redis.hset(key, 'created', str(int(time.time())))
                 self.redis.expire(key, Config.TRACKER_CACHE_TTL)
                 return
             except Exception as e:
-                logger.debug(f"[TrackerCache] Erro ao salvar cache Redis: {type(e).__name__}")
+                logger.debug("[TrackerCache] Erro ao salvar cache Redis: %s", type(e).__name__)
                 return
         
         if not self.redis:
@@ -9,7 +9,7 @@ nos dois enrichers.
 import logging
 import re
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from magnet.parser import MagnetParser
 from utils.text.utils import format_bytes
@@ -18,20 +18,8 @@ logger = logging.getLogger(__name__)
 
 
 def parse_cross_data(raw_map: Dict[bytes, bytes]) -> Dict[str, Any]:
-    parsed: Dict[str, Any] = {}
-    for field, value in (raw_map or {}).items():
-        field_str = field.decode('utf-8')
-        value_str = value.decode('utf-8')
-        if field_str in ('missing_dn', 'has_legenda'):
-            parsed[field_str] = value_str.lower() == 'true'
-        elif field_str in ('tracker_seed', 'tracker_leech'):
-            try:
-                parsed[field_str] = int(value_str) if value_str and value_str != 'N/A' else 0
-            except (TypeError, ValueError):
-                parsed[field_str] = 0
-        else:
-            parsed[field_str] = value_str if value_str and value_str != 'N/A' else None
-    return parsed
+    from utils.text.cross_data import decode_cross_data
+    return decode_cross_data(raw_map)
 
 
 def bulk_get_cross_data(info_hashes: List[str]) -> Dict[str, Dict[str, Any]]:
@@ -83,7 +71,7 @@ def apply_size_fallback(
     cross_data_by_hash: Optional[Dict[str, Dict[str, Any]]] = None,
 ) -> None:
     """Preenche size: cross_data → metadata → param xl do magnet → HTML."""
-    from utils.text.cross_data import save_cross_data_to_redis
+    from utils.text.cross_data import save_cross_data_batch
 
     metadata_enabled = not skip_metadata
     if cross_data_by_hash is None:
@@ -91,12 +79,12 @@ def apply_size_fallback(
             [str(t.get('info_hash') or '').lower() for t in torrents]
         )
 
+    # Sizes descobertos são gravados no fim, num único pipeline
+    pending_sizes: List[Tuple[str, Dict[str, Any]]] = []
+
     def _save_size(info_hash: str, size: str) -> None:
         if info_hash and len(info_hash) == 40:
-            try:
-                save_cross_data_to_redis(info_hash, {'size': size})
-            except Exception:
-                pass
+            pending_sizes.append((info_hash, {'size': size}))
 
     for torrent in torrents:
         html_size = torrent.get('size', '')
@@ -146,6 +134,9 @@ def apply_size_fallback(
             torrent['size'] = html_size
             _save_size(info_hash, html_size)
 
+    if pending_sizes:
+        save_cross_data_batch(pending_sizes)
+
 
 def apply_date_fallback(torrents: List[Dict], skip_metadata: bool = False) -> None:
     """Preenche date: metadata (creation date do .torrent) → data atual."""
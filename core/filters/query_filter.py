@@ -2,7 +2,7 @@
 
 import logging
 from typing import Dict, Callable
-from utils.text.query import check_query_match
+from utils.text.query import get_query_plan
 
 logger = logging.getLogger(__name__)
 
@@ -12,6 +12,8 @@ class QueryFilter:
         if not query:
             return lambda t: True
         
+        plan = get_query_plan(query)
+        
         def filter_func(torrent: Dict) -> bool:
             title_processed = torrent.get('title_processed') or ''
             original_title = torrent.get('original_title') or ''
@@ -21,8 +23,7 @@ class QueryFilter:
             original_title = str(original_title) if original_title is not None else ''
             title_translated = str(title_translated) if title_translated is not None else ''
             
-            result = check_query_match(
-                query,
+            result = plan.match(
                 title_processed,
                 original_title,
                 title_translated,
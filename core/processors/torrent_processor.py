@@ -1,116 +1,174 @@
 # Copyright (c) 2025 DFlexy · https://github.com/DFlexy
 
 import logging
-from typing import List, Dict, Any
+import re
+from collections import deque
+from functools import lru_cache
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple, Union
 from datetime import datetime
-from bs4 import Tag, NavigableString
 
 logger = logging.getLogger(__name__)
 
+_MAGNET_HASH_RE = re.compile(r'xt=urn:btih:([a-f0-9]{40})', re.IGNORECASE)
+
+# (Tag, NavigableString) importados sob demanda: bs4 só é necessário se algum valor não for primitivo
+_BS4_TYPES: Optional[Tuple[Any, Any]] = None
+
+def _bs4_types() -> Tuple[Any, Any]:
+    global _BS4_TYPES
+    if _BS4_TYPES is None:
+        from bs4 import Tag, NavigableString
+        _BS4_TYPES = (Tag, NavigableString)
+    return _BS4_TYPES
+
+def _sanitize_leaf(value: Any) -> Any:
+    tag_type, string_type = _BS4_TYPES or _bs4_types()
+    value_type = type(value)
+    if value_type is string_type:
+        return str(value)
+    if value_type is tag_type:
+        return value.get_text(strip=True)
+    # Subclasses de Tag/NavigableString (ex.: Comment) caem no isinstance
+    if isinstance(value, string_type):
+        return str(value)
+    if isinstance(value, tag_type):
+        return value.get_text(strip=True)
+    return value
+
+def _sanitize_container(root: Union[List[Any], Dict[Any, Any]]) -> None:
+    """Sanitiza listas/dicts aninhados in-place usando pilha explícita (sem recursão)."""
+    stack: Deque[Union[List[Any], Dict[Any, Any]]] = deque((root,))
+    while stack:
+        container = stack.pop()
+        if type(container) is dict:
+            items: Iterable[Tuple[Any, Any]] = container.items()
+        else:
+            items = enumerate(container)
+        for key, value in items:
+            value_type = type(value)
+            if value_type is list or value_type is dict:
+                stack.append(value)
+            elif value_type is not str and value is not None:
+                sanitized = _sanitize_leaf(value)
+                if sanitized is not value:
+                    container[key] = sanitized
+
+_DATETIME_MIN = datetime.min
+
+@lru_cache(maxsize=4096)
+def _parse_date_str(date_str: str) -> datetime:
+    # Formato mais comum (gerado pelo próprio indexer): YYYY-MM-DDTHH:MM:SSZ
+    if len(date_str) == 20 and date_str[19] == 'Z' and date_str[10] == 'T' and date_str[4] == '-' and date_str[7] == '-':
+        try:
+            return datetime(
+                int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]),
+                int(date_str[11:13]), int(date_str[14:16]), int(date_str[17:19]),
+            )
+        except ValueError:
+            pass
+
+    try:
+        dt = None
+        if 'T' in date_str:
+            if '+' in date_str or 'Z' in date_str:
+                dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+            else:
+                dt = datetime.fromisoformat(date_str)
+        else:
+            dt = datetime.strptime(date_str.split('T')[0], '%Y-%m-%d')
+
+        if dt.tzinfo is not None:
+            dt = dt.replace(tzinfo=None)
+
+        return dt
+    except (ValueError, AttributeError, TypeError):
+        return _DATETIME_MIN
+
+def _parse_date(date_str: Any) -> datetime:
+    """Converte a data do torrent em datetime naive para ordenação (datetime.min se inválida)."""
+    if not date_str or not isinstance(date_str, str):
+        return _DATETIME_MIN
+    return _parse_date_str(date_str)
+
+def _to_count(value: Any) -> int:
+    if value is None:
+        return 0
+    if type(value) is int:
+        return value
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return 0
+
 class TorrentProcessor:
     @staticmethod
     def _sanitize_value(value: Any) -> Any:
 
-        if value is None:
-            return None
-        
-        if isinstance(value, Tag):
-            return value.get_text(strip=True) if hasattr(value, 'get_text') else str(value)
-        
-        if isinstance(value, NavigableString):
-            return str(value)
-        
-        if isinstance(value, list):
-            return [TorrentProcessor._sanitize_value(item) for item in value]
-        
-        if isinstance(value, dict):
-            return {k: TorrentProcessor._sanitize_value(v) for k, v in value.items()}
-        
-        return value
+        value_type = type(value)
+        if value_type is list or value_type is dict:
+            _sanitize_container(value)
+            return value
+        if value is None or value_type is str:
+            return value
+        return _sanitize_leaf(value)
     
     @staticmethod
-    def sanitize_torrents(torrents: List[Dict]) -> None:
+    def sanitize_torrents(torrents: List[Dict[str, Any]]) -> None:
 
         for torrent in torrents:
             for key, value in list(torrent.items()):
-                sanitized = TorrentProcessor._sanitize_value(value)
-                if sanitized != value:
+                value_type = type(value)
+                if value_type is str or value is None:
+                    continue
+                if value_type is list or value_type is dict:
+                    _sanitize_container(value)
+                    continue
+                sanitized = _sanitize_leaf(value)
+                if sanitized is not value:
                     torrent[key] = sanitized
     
     @staticmethod
-    def remove_internal_fields(torrents: List[Dict]) -> None:
-        from datetime import datetime
+    def remove_internal_fields(torrents: List[Dict[str, Any]]) -> None:
+        # Data de fallback calculada uma vez por lote (e só se algum torrent precisar)
+        now_str: Optional[str] = None
         
         for torrent in torrents:
             torrent.pop('_metadata', None)
             torrent.pop('_metadata_fetched', None)
             torrent.pop('_original_order', None)
             
-
+            get = torrent.get
+            
             if 'title_processed' in torrent and 'title' not in torrent:
-                torrent['title'] = torrent.get('title_processed', '')
+                torrent['title'] = get('title_processed', '')
             
-            date_value = torrent.get('date')
+            date_value = get('date')
             if not date_value or (isinstance(date_value, str) and date_value.strip() == ''):
-                torrent['date'] = datetime.now().strftime('%Y-%m-%dT%H:%M:%SZ')
+                if now_str is None:
+                    now_str = datetime.now().strftime('%Y-%m-%dT%H:%M:%SZ')
+                torrent['date'] = now_str
             
-
-            if torrent.get('seed_count') is None:
-                torrent['seed_count'] = 0
-            else:
-                try:
-                    torrent['seed_count'] = int(torrent['seed_count'])
-                except (ValueError, TypeError):
-                    torrent['seed_count'] = 0
-            
-            if torrent.get('leech_count') is None:
-                torrent['leech_count'] = 0
-            else:
-                try:
-                    torrent['leech_count'] = int(torrent['leech_count'])
-                except (ValueError, TypeError):
-                    torrent['leech_count'] = 0
+            torrent['seed_count'] = _to_count(get('seed_count'))
+            torrent['leech_count'] = _to_count(get('leech_count'))
             
-            if not torrent.get('magnet_link') and torrent.get('magnet'):
-                torrent['magnet_link'] = torrent['magnet']
+            if not get('magnet_link'):
+                magnet = get('magnet')
+                if magnet:
+                    torrent['magnet_link'] = magnet
             
-            if not torrent.get('details'):
-                torrent['details'] = torrent.get('magnet_link', '')
+            if not get('details'):
+                torrent['details'] = get('magnet_link', '')
             
-            if not torrent.get('info_hash'):
-                magnet_link = torrent.get('magnet_link', '')
+            if not get('info_hash'):
+                magnet_link = get('magnet_link', '')
                 if magnet_link and 'xt=urn:btih:' in magnet_link.lower():
                     try:
-                        import re
-                        match = re.search(r'xt=urn:btih:([a-f0-9]{40})', magnet_link, re.IGNORECASE)
+                        match = _MAGNET_HASH_RE.search(magnet_link)
                         if match:
                             torrent['info_hash'] = match.group(1).lower()
                     except Exception:
                         pass
     
     @staticmethod
-    def sort_by_date(torrents: List[Dict], reverse: bool = True) -> None:
-        def sort_key(torrent: Dict) -> datetime:
-            date_str = torrent.get('date', '')
-            if not date_str:
-                return datetime.min.replace(tzinfo=None)
-            
-            try:
-                dt = None
-                if 'T' in date_str:
-                    if '+' in date_str or 'Z' in date_str:
-                        dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-                    else:
-                        dt = datetime.fromisoformat(date_str)
-                else:
-                    dt = datetime.strptime(date_str.split('T')[0], '%Y-%m-%d')
-                
-                if dt.tzinfo is not None:
-                    dt = dt.replace(tzinfo=None)
-                
-                return dt
-            except (ValueError, AttributeError, TypeError):
-                return datetime.min.replace(tzinfo=None)
-        
-        torrents.sort(key=sort_key, reverse=reverse)
-
+    def sort_by_date(torrents: List[Dict[str, Any]], reverse: bool = True) -> None:
+        torrents.sort(key=lambda torrent: _parse_date(torrent.get('date', '')), reverse=reverse)
@@ -3,9 +3,16 @@
 import re
 import hashlib
 import base64
-from urllib.parse import urlparse, parse_qs, unquote
+import binascii
+from urllib.parse import urlparse, parse_qs, unquote, unquote_to_bytes
 from typing import Dict, List, Optional
 
+_XT_BTIH_RE = re.compile(r'xt=urn:btih:([^&]+)', re.IGNORECASE)
+_PERCENT_HEX_RE = re.compile(r'%([0-9A-Fa-f]{2})')
+_HEX40_RE = re.compile(r'[0-9a-fA-F]{40}')
+_HEX_SET = frozenset(b'0123456789abcdefABCDEF')
+_NON_HEX_DELETE = bytes(b for b in range(256) if b not in _HEX_SET)
+
 class MagnetParser:
     @staticmethod
     def parse(uri: str) -> Dict:
@@ -13,24 +20,23 @@ class MagnetParser:
         if parsed.scheme != 'magnet':
             raise ValueError(f"Esquema inválido: {parsed.scheme}")
         
-        match = re.search(r'xt=urn:btih:([^&]+)', parsed.query, re.IGNORECASE)
+        match = _XT_BTIH_RE.search(parsed.query)
         if match:
             info_hash_raw = match.group(1)
             if '%' in info_hash_raw:
-                def replace_percent(match):
-                    hex_chars = match.group(1)
-                    if all(c in '0123456789abcdefABCDEF' for c in hex_chars):
-                        return hex_chars
-                    return ''
-                
-                info_hash_cleaned = re.sub(r'%([0-9A-Fa-f]{2})', replace_percent, info_hash_raw)
-                if len(info_hash_cleaned) in [32, 40]:
+                # %XX com hex válido vira os próprios dígitos (ex.: %AB -> AB)
+                info_hash_cleaned = _PERCENT_HEX_RE.sub(r'\1', info_hash_raw)
+                if len(info_hash_cleaned) in (32, 40):
                     info_hash_encoded = info_hash_cleaned
                 else:
-                    info_hash_decoded = unquote(info_hash_raw)
-                    if len(info_hash_decoded) in [32, 40]:
-                        info_hash_encoded = info_hash_decoded
-                    elif len(info_hash_raw) in [32, 40]:
+                    # Decodificação e filtro de hex em C (unquote_to_bytes + bytes.translate)
+                    decoded = unquote_to_bytes(info_hash_raw)
+                    hex_bytes = decoded.translate(None, _NON_HEX_DELETE)
+                    if len(hex_bytes) == 40:
+                        info_hash_encoded = hex_bytes.decode('ascii')
+                    elif len(decoded) == 32:
+                        info_hash_encoded = decoded.decode('ascii', 'ignore')
+                    elif len(info_hash_raw) in (32, 40):
                         info_hash_encoded = info_hash_raw
                     else:
                         info_hash_encoded = info_hash_cleaned
@@ -74,28 +80,16 @@ class MagnetParser:
     
     @staticmethod
     def _decode_infohash(encoded: str) -> bytes:
-        encoded_clean = ''.join(c for c in encoded if c.isalnum() or c in '+-=')
+        if len(encoded) == 40 and _HEX40_RE.match(encoded):
+            return bytes.fromhex(encoded)
         
-        hex_chars = ''.join(c for c in encoded_clean if c in '0123456789abcdefABCDEF')
+        # Remove tudo que não é hex em uma única chamada C (bytes.translate)
+        hex_chars = encoded.encode('ascii', 'ignore').translate(None, _NON_HEX_DELETE)
         
-        if len(hex_chars) == 40:
-            try:
-                return bytes.fromhex(hex_chars)
-            except ValueError:
-                pass
-        
-        if len(hex_chars) > 40:
-            try:
-                return bytes.fromhex(hex_chars[:40])
-            except ValueError:
-                pass
+        if len(hex_chars) >= 40:
+            return binascii.unhexlify(hex_chars[:40])
         
-        if len(encoded_clean) == 40:
-            try:
-                if all(c in '0123456789abcdefABCDEF' for c in encoded_clean):
-                    return bytes.fromhex(encoded_clean)
-            except ValueError:
-                pass
+        encoded_clean = ''.join(c for c in encoded if c.isalnum() or c in '+-=')
         
         if len(encoded_clean) == 32:
             try:
@@ -103,14 +97,6 @@ class MagnetParser:
             except Exception:
                 pass
         
-        if len(encoded) == 40:
-            try:
-                hex_only = ''.join(c for c in encoded if c in '0123456789abcdefABCDEF')
-                if len(hex_only) >= 40:
-                    return bytes.fromhex(hex_only[:40])
-            except ValueError:
-                pass
-        
         if len(encoded) == 32:
             try:
                 return base64.b32decode(encoded.upper())
@@ -118,4 +104,3 @@ class MagnetParser:
                 pass
         
         raise ValueError(f"Tamanho de info_hash inválido: {len(encoded_clean)} (original: {len(encoded)})")
-
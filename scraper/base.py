@@ -4,15 +4,19 @@ import logging
 import threading
 import time
 import html
+import re
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Callable, Tuple
 from bs4 import BeautifulSoup
 import requests
 from cache.redis_client import get_redis_client
+from cache.html_bloom import get_html_bloom
 from cache.redis_keys import html_long_key, html_short_key
 from app.config import Config
 from utils.http.flaresolverr import FlareSolverrClient
 from utils.http.proxy import get_proxy_dict, is_proxy_local
+from utils.parsing.date_extraction import get_release_year_extractor
+from utils.parsing.link_resolver import is_protected_link, resolve_protected_link
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +24,9 @@ _request_cache = threading.local()
 # HTML da última fetch por thread (evita race no processamento paralelo de páginas)
 _thread_fetched_html = threading.local()
 
+# Entidades de '&' que sobram em magnets (WordPress costuma duplicar o escape)
+_RE_MAGNET_AMP_ENTITY = re.compile(r'&(?:amp|#038);')
+
 _url_locks = {}
 _url_locks_lock = threading.Lock()
 _MAX_URL_LOCKS = 500
@@ -36,6 +43,13 @@ def _get_url_lock(url: str):
             _url_locks[url] = threading.Lock()
         return _url_locks[url]
 
+def _unescape_magnet(href: str) -> str:
+    href = _RE_MAGNET_AMP_ENTITY.sub('&', href)
+    # Outras entidades só aparecem com ';' (ex.: &#8211; no dn)
+    if ';' in href:
+        href = html.unescape(href)
+    return href
+
 def cleanup_url_state():
     """Limpa estado global de URLs (locks e fetching set). Chamar entre requisições."""
     with _url_locks_lock:
@@ -63,6 +77,7 @@ class BaseScraper(ABC):
             )
         self.base_url = resolved_url
         self.redis = get_redis_client()
+        self._release_year_extractor = get_release_year_extractor(self.SCRAPER_TYPE)
         
         self.session = requests.Session()
         adapter = requests.adapters.HTTPAdapter(
@@ -158,6 +173,11 @@ class BaseScraper(ABC):
         if thread_html:
             return thread_html
         return self._last_fetched_html or ''
+
+    def _fetched_html_may_contain(self, needle: str) -> bool:
+        """Pré-filtro no HTML bruto desta thread: False só quando `needle` com certeza não está na página."""
+        page_html = getattr(_thread_fetched_html, 'html', None)
+        return not page_html or needle in page_html
     
     def get_document(self, url: str, referer: str = '') -> Optional[BeautifulSoup]:
         self._last_fetched_html = None
@@ -173,44 +193,20 @@ class BaseScraper(ABC):
         
         if self.redis and not self._is_test:
             try:
-                cache_key = html_long_key(url)
-                cached = self.redis.get(cache_key)
-                if cached:
-                    self._cache_stats['html']['hits'] += 1
-                    return self._soup_from_html(cached)
-            except (AttributeError, TypeError) as e:
-                logger.debug(f"Redis cache error (long): {type(e).__name__}")
-            except Exception as e:
-                logger.debug(f"Unexpected Redis error (long): {type(e).__name__}")
-        
-        if self.redis and not self._is_test:
-            try:
-                short_cache_key = html_short_key(url)
-                cached = self.redis.get(short_cache_key)
+                cached = self._get_cached_html(url)
                 if cached:
                     self._cache_stats['html']['hits'] += 1
                     return self._soup_from_html(cached)
             except (AttributeError, TypeError) as e:
-                logger.debug(f"Redis cache error (short): {type(e).__name__}")
+                logger.debug("Redis cache error: %s", type(e).__name__)
             except Exception as e:
-                logger.debug(f"Unexpected Redis error (short): {type(e).__name__}")
+                logger.debug("Unexpected Redis error: %s", type(e).__name__)
         
         url_lock = _get_url_lock(url)
         with url_lock:
             if self.redis and not self._is_test:
                 try:
-                    cache_key = html_long_key(url)
-                    cached = self.redis.get(cache_key)
-                    if cached:
-                        self._cache_stats['html']['hits'] += 1
-                        return self._soup_from_html(cached)
-                except Exception:
-                    pass
-            
-            if self.redis and not self._is_test:
-                try:
-                    short_cache_key = html_short_key(url)
-                    cached = self.redis.get(short_cache_key)
+                    cached = self._get_cached_html(url)
                     if cached:
                         self._cache_stats['html']['hits'] += 1
                         return self._soup_from_html(cached)
@@ -230,8 +226,7 @@ class BaseScraper(ABC):
                     time.sleep(0.1)
                     if self.redis and not self._is_test:
                         try:
-                            cache_key = html_long_key(url)
-                            cached = self.redis.get(cache_key)
+                            cached = self._get_cached_html(url)
                             if cached:
                                 self._cache_stats['html']['hits'] += 1
                                 return self._soup_from_html(cached)
@@ -246,6 +241,45 @@ class BaseScraper(ABC):
                 with _url_fetching_lock:
                     _url_fetching.discard(url)
     
+    def _get_cached_html(self, url: str) -> Optional[bytes]:
+        """Busca o HTML nas chaves long/short do Redis em um único round-trip (long tem prioridade).
+
+        Hits do Redis são promovidos para o cache local, que atende as próximas leituras sem rede.
+        """
+        if not get_html_bloom().might_contain(url):
+            return None
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.get(html_long_key(url))
+        pipe.get(html_short_key(url))
+        cached_long, cached_short = pipe.execute()
+        cached = cached_long or cached_short
+        if cached:
+            from cache.http_cache import get_http_cache
+            get_http_cache().set(url, cached)
+        return cached
+    
+    def _store_html_cache(self, url: str, html_content, failure_key: Optional[str] = None) -> None:
+        """Grava o HTML no cache local e nas chaves short/long do Redis (pipeline, um round-trip)."""
+        if self._is_test:
+            return
+        try:
+            from cache.http_cache import get_http_cache
+            get_http_cache().set(url, html_content)
+        except Exception:
+            pass
+        
+        if self.redis:
+            try:
+                get_html_bloom().add(url)
+                pipe = self.redis.pipeline(transaction=False)
+                if failure_key:
+                    pipe.delete(failure_key)
+                pipe.setex(html_short_key(url), Config.HTML_CACHE_TTL_SHORT, html_content)
+                pipe.setex(html_long_key(url), Config.HTML_CACHE_TTL_LONG, html_content)
+                pipe.execute()
+            except Exception:
+                pass
+    
     def _fetch_document(self, url: str, referer: str = '') -> Optional[BeautifulSoup]:
         self._cache_stats['html']['misses'] += 1
         
@@ -259,9 +293,9 @@ class BaseScraper(ABC):
         
         if self.use_flaresolverr and not use_flaresolverr_for_this_url:
             if not self.flaresolverr_client:
-                logger.debug(f"FlareSolverr habilitado mas cliente não disponível para {url[:50]}...")
+                logger.debug("FlareSolverr habilitado mas cliente não disponível para %.50s...", url)
             elif "%3A" in url or "%3a" in url.lower():
-                logger.debug(f"FlareSolverr pulado: URL contém %3A para {url[:50]}...")
+                logger.debug("FlareSolverr pulado: URL contém %%3A para %.50s...", url)
         
         if use_flaresolverr_for_this_url:
             try:
@@ -292,32 +326,8 @@ class BaseScraper(ABC):
                             logger.warning(f"FlareSolverr: HTML retornado não corresponde à URL! URL: {url[:80]}... | HTML size: {len(html_str)} bytes")
                             html_content = None
                         else:
-                            logger.debug(f"FlareSolverr: sucesso para {url[:50]}... ({len(html_content)} bytes)")
-                            if not self._is_test:
-                                try:
-                                    from cache.http_cache import get_http_cache
-                                    http_cache = get_http_cache()
-                                    http_cache.set(url, html_content)
-                                except Exception:
-                                    pass
-                            
-                            if self.redis and not self._is_test:
-                                try:
-                                    short_cache_key = html_short_key(url)
-                                    self.redis.setex(
-                                        short_cache_key,
-                                        Config.HTML_CACHE_TTL_SHORT,
-                                        html_content
-                                    )
-                                    
-                                    cache_key = html_long_key(url)
-                                    self.redis.setex(
-                                        cache_key,
-                                        Config.HTML_CACHE_TTL_LONG,
-                                        html_content
-                                    )
-                                except Exception:
-                                    pass
+                            logger.debug("FlareSolverr: sucesso para %.50s... (%d bytes)", url, len(html_content))
+                            self._store_html_cache(url, html_content)
                             
                             return self._soup_from_html(html_content)
                     else:
@@ -352,7 +362,7 @@ class BaseScraper(ABC):
                             )
                             if new_session_id:
                                 if new_session_id != session_id:
-                                    logger.debug(f"FlareSolverr: usando nova sessão (anterior: {session_id[:20]}..., nova: {new_session_id[:20]}...)")
+                                    logger.debug("FlareSolverr: usando nova sessão (anterior: %.20s..., nova: %.20s...)", session_id, new_session_id)
                                 
                                 html_content = self.flaresolverr_client.solve(
                                     url,
@@ -369,32 +379,7 @@ class BaseScraper(ABC):
                                         logger.warning(f"FlareSolverr retry: HTML retornado não corresponde à URL! URL: {url[:80]}... | HTML size: {len(html_str)} bytes")
                                         html_content = None
                                     else:
-                                        if not self._is_test:
-                                            try:
-                                                from cache.http_cache import get_http_cache
-                                                http_cache = get_http_cache()
-                                                http_cache.set(url, html_content)
-                                            except Exception:
-                                                pass
-                                        
-                                        if self.redis and not self._is_test:
-                                            try:
-                                                self.redis.delete(failure_key)
-                                                short_cache_key = html_short_key(url)
-                                                self.redis.setex(
-                                                    short_cache_key,
-                                                    Config.HTML_CACHE_TTL_SHORT,
-                                                    html_content
-                                                )
-                                                
-                                                cache_key = html_long_key(url)
-                                                self.redis.setex(
-                                                    cache_key,
-                                                    Config.HTML_CACHE_TTL_LONG,
-                                                    html_content
-                                                )
-                                            except Exception:
-                                                pass
+                                        self._store_html_cache(url, html_content, failure_key=failure_key)
                                         
                                         return self._soup_from_html(html_content)
                                 else:
@@ -408,7 +393,7 @@ class BaseScraper(ABC):
                                             _request_cache.flaresolverr_failures = {}
                                         _request_cache.flaresolverr_failures[failure_key] = time.time() + 300
             except Exception as e:
-                logger.debug(f"FlareSolverr error: {type(e).__name__} - tentando requisição direta")
+                logger.debug("FlareSolverr error: %s - tentando requisição direta", type(e).__name__)
         
         if use_flaresolverr_for_this_url and not html_content:
             from cache.redis_keys import flaresolverr_failure_key
@@ -452,32 +437,7 @@ class BaseScraper(ABC):
                                 logger.warning(f"FlareSolverr retry (cache expirado): HTML retornado não corresponde à URL! URL: {url[:80]}... | HTML size: {len(html_str)} bytes")
                                 html_content = None
                             else:
-                                if not self._is_test:
-                                    try:
-                                        from cache.http_cache import get_http_cache
-                                        http_cache = get_http_cache()
-                                        http_cache.set(url, html_content)
-                                    except Exception:
-                                        pass
-                                
-                                if self.redis and not self._is_test:
-                                    try:
-                                        self.redis.delete(failure_key)
-                                        short_cache_key = html_short_key(url)
-                                        self.redis.setex(
-                                            short_cache_key,
-                                            Config.HTML_CACHE_TTL_SHORT,
-                                            html_content
-                                        )
-                                        
-                                        cache_key = html_long_key(url)
-                                        self.redis.setex(
-                                            cache_key,
-                                            Config.HTML_CACHE_TTL_LONG,
-                                            html_content
-                                        )
-                                    except Exception:
-                                        pass
+                                self._store_html_cache(url, html_content, failure_key=failure_key)
                                 
                                 return self._soup_from_html(html_content)
                         else:
@@ -491,10 +451,10 @@ class BaseScraper(ABC):
                                     _request_cache.flaresolverr_failures = {}
                                 _request_cache.flaresolverr_failures[failure_key] = time.time() + 300
                 except Exception as e:
-                    logger.debug(f"FlareSolverr retry error: {type(e).__name__} - tentando requisição direta")
+                    logger.debug("FlareSolverr retry error: %s - tentando requisição direta", type(e).__name__)
         
         if self.use_flaresolverr and not html_content:
-            logger.debug(f"FlareSolverr habilitado mas requisição direta será feita para {url[:50]}... (pode resultar em 403)")
+            logger.debug("FlareSolverr habilitado mas requisição direta será feita para %.50s... (pode resultar em 403)", url)
         
         headers = {'Referer': referer if referer else self.base_url}
         
@@ -506,31 +466,7 @@ class BaseScraper(ABC):
             response.raise_for_status()
             html_content = response.content
             
-            if not self._is_test:
-                try:
-                    from cache.http_cache import get_http_cache
-                    http_cache = get_http_cache()
-                    http_cache.set(url, html_content)
-                except Exception:
-                    pass
-            
-            if self.redis and not self._is_test:
-                try:
-                    short_cache_key = html_short_key(url)
-                    self.redis.setex(
-                        short_cache_key,
-                        Config.HTML_CACHE_TTL_SHORT,
-                        html_content
-                    )
-                    
-                    cache_key = html_long_key(url)
-                    self.redis.setex(
-                        cache_key,
-                        Config.HTML_CACHE_TTL_LONG,
-                        html_content
-                    )
-                except Exception:
-                    pass
+            self._store_html_cache(url, html_content)
             
             return self._soup_from_html(html_content)
         
@@ -697,7 +633,7 @@ class BaseScraper(ABC):
 
     def _filter_links_by_result_titles(self, doc: BeautifulSoup, links: List[str], query: str) -> List[str]:
         """Filtra links de busca usando só o título do card de resultado."""
-        from utils.text.query import check_query_match
+        from utils.text.query import get_query_plan
 
         if not links or not query or not query.strip():
             return links
@@ -706,6 +642,7 @@ class BaseScraper(ABC):
         if not title_by_url:
             return links
 
+        plan = get_query_plan(query)
         filtered: List[str] = []
         for href in links:
             normalized = self._normalize_search_result_url(href)
@@ -714,7 +651,7 @@ class BaseScraper(ABC):
             if not title_text:
                 filtered.append(href)
                 continue
-            if check_query_match(query, title_text, '', ''):
+            if plan.match(title_text):
                 filtered.append(href)
 
         return filtered
@@ -801,7 +738,7 @@ class BaseScraper(ABC):
 
             scraper_name = getattr(self, 'DISPLAY_NAME', '') or getattr(self, 'SCRAPER_TYPE', 'UNKNOWN')
             if not links:
-                logger.debug(f"[{scraper_name}] Nenhuma página encontrada para a query: '{query}'")
+                logger.debug("[%s] Nenhuma página encontrada para a query: '%s'", scraper_name, query)
 
             from utils.concurrency.scraper_helpers import process_links_parallel
             all_torrents = process_links_parallel(
@@ -853,16 +790,14 @@ class BaseScraper(ABC):
         href = html.unescape(href.strip())
         
         if href.startswith('magnet:'):
-            href = href.replace('&amp;', '&').replace('&#038;', '&')
-            return html.unescape(href)
+            return _unescape_magnet(href)
         
         try:
-            from utils.parsing.link_resolver import is_protected_link, resolve_protected_link
             if is_protected_link(href):
                 resolved = resolve_protected_link(href, self.session, self.base_url, redis=self.redis)
                 return resolved
         except Exception as e:
-            logger.debug(f"Link resolver error: {type(e).__name__}")
+            logger.debug("Link resolver error: %s", type(e).__name__)
         
         return None
     
@@ -174,7 +174,7 @@ class BludvScraper(BaseScraper):
             return []
         
         from utils.parsing.date_extraction import extract_date_from_page
-        date = extract_date_from_page(doc, absolute_link, self.SCRAPER_TYPE)
+        date = extract_date_from_page(doc, absolute_link, extractor=self._release_year_extractor)
         
         torrents = []
         
@@ -345,16 +345,19 @@ class BludvScraper(BaseScraper):
                 sizes.extend(find_sizes_from_text(html_content))
 
         from utils.parsing.imdb_extraction import extract_imdb_from_soup
-        imdb = extract_imdb_from_soup(
-            content_div or article,
-            content_div=content_div,
-            label_tag='em',
-            label_regex=r'IMDb:',
-        ) if content_div else extract_imdb_from_soup(article)
+        imdb = ''
+        if self._fetched_html_may_contain('imdb.com'):
+            imdb = extract_imdb_from_soup(
+                content_div or article,
+                content_div=content_div,
+                label_tag='em',
+                label_regex=r'IMDb:',
+            ) if content_div else extract_imdb_from_soup(article)
         
-        all_links = doc.select('a[href]')
+        all_links = doc.find_all('a', href=True)
         
         magnet_links = []
+        seen_magnets: set = set()
         for link in all_links:
             href = link.get('href', '')
             if not href:
@@ -362,7 +365,8 @@ class BludvScraper(BaseScraper):
             
             resolved_magnet = self._resolve_link(href)
             if resolved_magnet and resolved_magnet.startswith('magnet:'):
-                if resolved_magnet not in magnet_links:
+                if resolved_magnet not in seen_magnets:
+                    seen_magnets.add(resolved_magnet)
                     magnet_links.append(resolved_magnet)
         
         if not magnet_links:
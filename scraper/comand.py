@@ -44,10 +44,8 @@ class ComandScraper(BaseScraper):
             
             month = self.month_replacer.get(month_name)
             if month:
-                date_str = f"{year}-{month}-{day}"
                 try:
-                    date = datetime.strptime(date_str, '%Y-%m-%d')
-                    return date
+                    return datetime(int(year), int(month), int(day))
                 except ValueError:
                     pass
         return None
@@ -122,7 +120,7 @@ class ComandScraper(BaseScraper):
         
         if not date:
             from utils.parsing.date_extraction import extract_date_from_page
-            date = extract_date_from_page(doc, absolute_link, self.SCRAPER_TYPE)
+            date = extract_date_from_page(doc, absolute_link, extractor=self._release_year_extractor)
         
         torrents = []
         article = doc.find('article')
@@ -327,7 +325,10 @@ class ComandScraper(BaseScraper):
             sizes = list(dict.fromkeys(sizes))
             
             from utils.parsing.imdb_extraction import extract_imdb_from_soup
-            imdb = extract_imdb_from_soup(entry_content, content_div=entry_content) if entry_content else ''
+            imdb = ''
+            # Sem "imdb.com" no HTML bruto nenhuma âncora casaria: evita varrer a árvore
+            if entry_content and self._fetched_html_may_contain('imdb.com'):
+                imdb = extract_imdb_from_soup(entry_content, content_div=entry_content)
         
         title_translated_processed = ''
         if entry_content:
@@ -428,19 +429,21 @@ class ComandScraper(BaseScraper):
             legend_info = determine_legend_info(legenda) if legenda else None
         
         magnet_links = []
+        seen_magnets: set = set()
         if entry_content:
-            for link in entry_content.select('a[href]'):
+            for link in entry_content.find_all('a', href=True):
                 href = link.get('href', '')
                 if not href:
                     continue
                 
                 resolved_magnet = self._resolve_link(href)
                 if resolved_magnet and resolved_magnet.startswith('magnet:'):
-                    if resolved_magnet not in magnet_links:
+                    if resolved_magnet not in seen_magnets:
+                        seen_magnets.add(resolved_magnet)
                         magnet_links.append(resolved_magnet)
         
         if not magnet_links:
-            all_links = doc.select('a[href]')
+            all_links = doc.find_all('a', href=True)
             for link in all_links:
                 href = link.get('href', '')
                 if not href:
@@ -448,7 +451,8 @@ class ComandScraper(BaseScraper):
                 
                 resolved_magnet = self._resolve_link(href)
                 if resolved_magnet and resolved_magnet.startswith('magnet:'):
-                    if resolved_magnet not in magnet_links:
+                    if resolved_magnet not in seen_magnets:
+                        seen_magnets.add(resolved_magnet)
                         magnet_links.append(resolved_magnet)
         
         if not magnet_links:
@@ -5,7 +5,7 @@ import re
 import logging
 from datetime import datetime
 from utils.parsing.date_extraction import parse_date_from_string
-from typing import List, Dict, Optional, Callable
+from typing import List, Dict, Optional, Callable, Tuple
 from urllib.parse import quote, quote_plus, unquote, urljoin
 from bs4 import BeautifulSoup
 from scraper.base import BaseScraper
@@ -17,6 +17,49 @@ logger = logging.getLogger(__name__)
 
 _log_ctx = ScraperLogContext("Rede", logger)
 
+_RE_BR = re.compile(r'<br\s*\/?>')
+_RE_TAG = re.compile(r'<[^>]*>')
+_RE_SENTENCE_END = re.compile(r'^[^.!?]*[.!?]')
+_ORIGINAL_LABEL = 'Título Original:'
+_TRANSLATED_LABEL = 'Título Traduzido:'
+_RE_ORIGINAL_TITLE = re.compile(r'Título Original:\s*([^\n\r]{1,200}?)(?:\s*(?:Gênero|Ano|Duração|Direção|Elenco|Sinopse|$))')
+_RE_TRANSLATED_TITLE = re.compile(r'Título Traduzido:\s*([^\n\r]{1,200}?)(?:\s*(?:Gênero|Ano|Duração|Direção|Elenco|Sinopse|Título Original|$))')
+
+def _label_value(line: str, label: str, label_re: re.Pattern) -> str:
+    match = label_re.search(line)
+    if match:
+        value = match.group(1).strip()
+    else:
+        extracted = line.split(label, 1)[1].strip()[:200]
+        stop_match = _RE_SENTENCE_END.search(extracted)
+        if stop_match:
+            extracted = stop_match.group(0)
+        value = extracted.strip()
+    return value.rstrip(' .,:;-')
+
+def _extract_informacoes_titles(article) -> Tuple[str, str]:
+    """Título original e traduzido de div#informacoes numa única passada pelos <p>.
+
+    Original: vale o último <p> com o rótulo; traduzido: o primeiro valor não vazio.
+    """
+    original_title = ''
+    translated_title = ''
+    for p in article.select('div#informacoes > p'):
+        html_content = str(p).replace('\n', '').replace('\t', '')
+        lines = [_RE_TAG.sub('', line).strip() for line in _RE_BR.sub('<br>', html_content).split('<br>')]
+        
+        for line in lines:
+            if _ORIGINAL_LABEL in line:
+                original_title = _label_value(line, _ORIGINAL_LABEL, _RE_ORIGINAL_TITLE)
+                break
+        
+        if not translated_title:
+            for line in lines:
+                if _TRANSLATED_LABEL in line:
+                    translated_title = _label_value(line, _TRANSLATED_LABEL, _RE_TRANSLATED_TITLE)
+                    break
+    return original_title, translated_title
+
 class RedeScraper(BaseScraper):
     SCRAPER_TYPE = "rede"
     DEFAULT_BASE_URL = "https://redetorrent.com/"
@@ -173,7 +216,7 @@ class RedeScraper(BaseScraper):
             return []
         
         from utils.parsing.date_extraction import extract_date_from_page
-        date = extract_date_from_page(doc, absolute_link, self.SCRAPER_TYPE)
+        date = extract_date_from_page(doc, absolute_link, extractor=self._release_year_extractor)
         
         torrents = []
         article = doc.find('div', class_='conteudo')
@@ -205,65 +248,7 @@ class RedeScraper(BaseScraper):
                 self._log_structure_miss(absolute_link, "padrão 'Título (Ano)' no h1")
                 return []
         
-        original_title = ''
-        for p in article.select('div#informacoes > p'):
-            html_content = str(p)
-            html_content = html_content.replace('\n', '').replace('\t', '')
-            html_content = re.sub(r'<br\s*\/?>', '<br>', html_content)
-            lines = html_content.split('<br>')
-            
-            for line in lines:
-                line = re.sub(r'<[^>]*>', '', line).strip()
-                if 'Título Original:' in line:
-                    title_regex = re.compile(r'Título Original:\s*([^\n\r]{1,200}?)(?:\s*(?:Gênero|Ano|Duração|Direção|Elenco|Sinopse|$))')
-                    match = title_regex.search(line)
-                    if match:
-                        original_title = match.group(1).strip()
-                    else:
-                        parts = line.split('Título Original:')
-                        if len(parts) > 1:
-                            extracted = parts[1].strip()
-                            if len(extracted) > 200:
-                                extracted = extracted[:200]
-                            stop_regex = re.compile(r'^[^.!?]*[.!?]')
-                            stop_match = stop_regex.search(extracted)
-                            if stop_match:
-                                extracted = stop_match.group(0)
-                            original_title = extracted.strip()
-                    
-                    original_title = original_title.rstrip(' .,:;-')
-                    break
-        
-        title_translated_processed = ''
-        for p in article.select('div#informacoes > p'):
-            html_content = str(p)
-            html_content = html_content.replace('\n', '').replace('\t', '')
-            html_content = re.sub(r'<br\s*\/?>', '<br>', html_content)
-            lines = html_content.split('<br>')
-            
-            for line in lines:
-                line_clean = re.sub(r'<[^>]*>', '', line).strip()
-                if 'Título Traduzido:' in line_clean:
-                    title_regex = re.compile(r'Título Traduzido:\s*([^\n\r]{1,200}?)(?:\s*(?:Gênero|Ano|Duração|Direção|Elenco|Sinopse|Título Original|$))')
-                    match = title_regex.search(line_clean)
-                    if match:
-                        title_translated_processed = match.group(1).strip()
-                    else:
-                        parts = line_clean.split('Título Traduzido:')
-                        if len(parts) > 1:
-                            extracted = parts[1].strip()
-                            if len(extracted) > 200:
-                                extracted = extracted[:200]
-                            stop_regex = re.compile(r'^[^.!?]*[.!?]')
-                            stop_match = stop_regex.search(extracted)
-                            if stop_match:
-                                extracted = stop_match.group(0)
-                            title_translated_processed = extracted.strip()
-                    
-                    title_translated_processed = title_translated_processed.rstrip(' .,:;-')
-                    break
-            if title_translated_processed:
-                break
+        original_title, title_translated_processed = _extract_informacoes_titles(article)
         
         if not original_title:
             original_title = title
@@ -354,19 +339,21 @@ class RedeScraper(BaseScraper):
         text_content = article.find('div', class_='apenas_itemprop')
         
         magnet_links = []
+        seen_magnets: set = set()
         if text_content:
-            for link in text_content.select('a[href]'):
+            for link in text_content.find_all('a', href=True):
                 href = link.get('href', '')
                 if not href:
                     continue
                 
                 resolved_magnet = self._resolve_link(href)
                 if resolved_magnet and resolved_magnet.startswith('magnet:'):
-                    if resolved_magnet not in magnet_links:
+                    if resolved_magnet not in seen_magnets:
+                        seen_magnets.add(resolved_magnet)
                         magnet_links.append(resolved_magnet)
         
         if not magnet_links:
-            all_links = doc.select('a[href]')
+            all_links = doc.find_all('a', href=True)
             for link in all_links:
                 href = link.get('href', '')
                 if not href:
@@ -374,16 +361,18 @@ class RedeScraper(BaseScraper):
                 
                 resolved_magnet = self._resolve_link(href)
                 if resolved_magnet and resolved_magnet.startswith('magnet:'):
-                    if resolved_magnet not in magnet_links:
+                    if resolved_magnet not in seen_magnets:
+                        seen_magnets.add(resolved_magnet)
                         magnet_links.append(resolved_magnet)
         
         if not magnet_links:
             return []
         
         imdb = ''
-        from utils.parsing.imdb_extraction import extract_imdb_from_soup
-        info_div = article.find('div', id='informacoes')
-        imdb = extract_imdb_from_soup(article, content_div=info_div)
+        if self._fetched_html_may_contain('imdb.com'):
+            from utils.parsing.imdb_extraction import extract_imdb_from_soup
+            info_div = article.find('div', id='informacoes')
+            imdb = extract_imdb_from_soup(article, content_div=info_div)
 
         sizes = list(dict.fromkeys(sizes))
         
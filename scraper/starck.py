@@ -566,7 +566,7 @@ class StarckScraper(BaseScraper):
     def _filter_links_by_result_titles(self, doc: BeautifulSoup, links: List[str], query: str) -> List[str]:
         """Filtra cards Starck; aceita título PT quando a season da query bate."""
         from utils.text.query import (
-            check_query_match,
+            get_query_plan,
             extract_query_season,
             slug_has_season,
             title_has_season,
@@ -577,6 +577,7 @@ class StarckScraper(BaseScraper):
 
         title_by_url = self._collect_search_result_titles(doc)
         season = extract_query_season(query)
+        plan = get_query_plan(query)
         filtered: List[str] = []
         for href in links:
             if season is not None:
@@ -592,7 +593,7 @@ class StarckScraper(BaseScraper):
             if not title_text:
                 filtered.append(href)
                 continue
-            if check_query_match(query, title_text, '', ''):
+            if plan.match(title_text):
                 filtered.append(href)
                 continue
             # Query EN vs card PT: mantém se a season do título confere.
@@ -650,7 +651,7 @@ class StarckScraper(BaseScraper):
             return []
         
         from utils.parsing.date_extraction import extract_date_from_page
-        date = extract_date_from_page(doc, absolute_link, self.SCRAPER_TYPE)
+        date = extract_date_from_page(doc, absolute_link, extractor=self._release_year_extractor)
         
         torrents = []
         post = doc.find('div', class_='post')
@@ -731,7 +732,7 @@ class StarckScraper(BaseScraper):
         if all_paragraphs_html:
             audio_html_content = ' '.join(all_paragraphs_html)
         
-        all_links = post.select('a[href]')
+        all_links = post.find_all('a', href=True)
 
         magnet_links: List[str] = []
         seen_hashes: set = set()
@@ -142,7 +142,7 @@ class TfilmeScraper(BaseScraper):
         def _scan_links(root) -> None:
             candidates = []
             other = []
-            for link in root.select('a[href]'):
+            for link in root.find_all('a', href=True):
                 href = html.unescape((link.get('href') or '').strip())
                 if not href:
                     continue
@@ -235,7 +235,7 @@ class TfilmeScraper(BaseScraper):
             return []
         
         from utils.parsing.date_extraction import extract_date_from_page
-        date = extract_date_from_page(doc, absolute_link, self.SCRAPER_TYPE)
+        date = extract_date_from_page(doc, absolute_link, extractor=self._release_year_extractor)
         
         torrents = []
         article = doc.find('article')
@@ -373,9 +373,11 @@ class TfilmeScraper(BaseScraper):
         if not magnet_links:
             return []
         
-        from utils.parsing.imdb_extraction import extract_imdb_from_soup
-        content_div = article.find('div', class_='content')
-        imdb = extract_imdb_from_soup(article, content_div=content_div)
+        imdb = ''
+        if self._fetched_html_may_contain('imdb.com'):
+            from utils.parsing.imdb_extraction import extract_imdb_from_soup
+            content_div = article.find('div', class_='content')
+            imdb = extract_imdb_from_soup(article, content_div=content_div)
 
         sizes = list(dict.fromkeys(sizes))
 
@@ -0,0 +1,80 @@
+# Copyright (c) 2025 DFlexy · https://github.com/DFlexy
+
+import unittest
+from unittest import mock
+
+from utils.text import cross_data
+
+INFO_HASH = 'ab' * 20
+
+class _FakePipeline:
+    def __init__(self, redis):
+        self._redis = redis
+        self._ops = []
+
+    def __getattr__(self, name):
+        def record(*args, **kwargs):
+            self._ops.append((name, args, kwargs))
+            return self
+        return record
+
+    def execute(self):
+        if self._redis.before_execute:
+            hook, self._redis.before_execute = self._redis.before_execute, None
+            hook()
+        return [getattr(self._redis, name)(*args, **kwargs) for name, args, kwargs in self._ops]
+
+class _FakeRedis:
+    """Redis mínimo em memória (HSET/HGETALL/TTL/EXPIRE) com gancho antes do execute do pipeline."""
+
+    def __init__(self):
+        self.hashes = {}
+        self.before_execute = None
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+    def hset(self, key, mapping):
+        self.hashes.setdefault(key, {}).update({k.encode(): str(v).encode() for k, v in mapping.items()})
+        return len(mapping)
+
+    def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    def ttl(self, key):
+        return -1 if key in self.hashes else -2
+
+    def expire(self, key, ttl):
+        return True
+
+class LocalCacheInvalidationTest(unittest.TestCase):
+
+    def setUp(self):
+        self.redis = _FakeRedis()
+        patcher = mock.patch('cache.redis_client.get_redis_client', return_value=self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        cross_data._local_cache.clear()
+        self.addCleanup(cross_data._local_cache.clear)
+        self.assertTrue(cross_data._local_cache.enabled)
+
+    def test_read_between_invalidate_and_write_is_not_served(self):
+        cross_data.save_cross_data_to_redis(INFO_HASH, {'metadata_name': 'Old.Name'})
+        self.assertEqual(cross_data.get_cross_data_from_redis(INFO_HASH)['metadata_name'], 'Old.Name')
+
+        # Leitura concorrente logo antes do HSET: recoloca o valor antigo no cache local
+        self.redis.before_execute = lambda: cross_data.get_cross_data_from_redis(INFO_HASH)
+        cross_data.save_cross_data_to_redis(INFO_HASH, {'metadata_name': 'New.Name'})
+
+        self.assertEqual(cross_data.get_cross_data_from_redis(INFO_HASH)['metadata_name'], 'New.Name')
+
+    def test_async_save_invalidates_on_enqueue(self):
+        cross_data.save_cross_data_to_redis(INFO_HASH, {'metadata_name': 'Old.Name'})
+        self.assertIsNotNone(cross_data.get_cross_data_from_redis(INFO_HASH))
+
+        with mock.patch.object(cross_data, 'save_cross_data_batch'):
+            cross_data.save_cross_data_async(INFO_HASH.upper(), {'metadata_name': 'New.Name'})
+            self.assertIsNone(cross_data._local_cache.get(INFO_HASH))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+# Copyright (c) 2025 DFlexy · https://github.com/DFlexy
+
+import unittest
+
+from utils.text.query import _title_has_episode, check_query_match, get_query_plan
+
+class WordMatchTest(unittest.TestCase):
+    """Palavras da query casam como prefixo no início de uma palavra do título."""
+
+    def test_prefix_at_word_boundary(self):
+        self.assertTrue(check_query_match('matrix', 'The.Matrix.Reloaded.2003.1080p'))
+        self.assertTrue(check_query_match('matri', 'The.Matrix.Reloaded.2003.1080p'))
+        self.assertTrue(check_query_match('lost', 'Lostinho.S03'))
+
+    def test_no_match_inside_word(self):
+        self.assertFalse(check_query_match('atrix', 'The.Matrix.Reloaded.2003.1080p'))
+        self.assertFalse(check_query_match('lost', 'Almost.S03'))
+
+    def test_accents_and_separators(self):
+        self.assertTrue(check_query_match('acao', 'Filme de Ação 2020'))
+        self.assertTrue(check_query_match('ação', 'Filme de Acao 2020'))
+        self.assertTrue(check_query_match('spider man', 'Spider-Man.No.Way.Home.2021'))
+        self.assertTrue(check_query_match('homem aranha', 'Homem-Aranha Sem Volta Para Casa (2021)'))
+
+    def test_two_words_must_both_match(self):
+        self.assertTrue(check_query_match('vingadores ultimato', 'Vingadores.Ultimato.2019'))
+        self.assertFalse(check_query_match('vingadores ultimato', 'Vingadores.Guerra.Infinita.2018'))
+        self.assertTrue(check_query_match('house dragon', 'Dragon.House.2022'))
+
+    def test_original_and_translated_titles(self):
+        self.assertTrue(check_query_match('matrix', 'Outro', 'The Matrix'))
+        self.assertTrue(check_query_match('matrix', 'Outro', '', 'Matrix Reloaded'))
+
+    def test_empty_query_matches_everything(self):
+        self.assertTrue(check_query_match('', 'Qualquer.Titulo'))
+        self.assertTrue(check_query_match('the of', 'Qualquer.Titulo'))
+        self.assertFalse(check_query_match('matrix', ''))
+
+class SeasonMatchTest(unittest.TestCase):
+
+    def test_season_digit(self):
+        self.assertTrue(check_query_match('lost 2', 'Lost.S02E02.720p'))
+        self.assertFalse(check_query_match('lost 2', 'Lost.S03.720p'))
+        self.assertTrue(check_query_match('breaking bad 2', 'Breaking.Bad.S02.1080p'))
+
+    def test_season_token(self):
+        self.assertTrue(check_query_match('the boys s03', 'The.Boys.S03E01.720p'))
+        self.assertFalse(check_query_match('the boys s03', 'The.Boys.S04E01.720p'))
+        self.assertTrue(check_query_match('dark 3 temporada', 'Dark.S03.Complete'))
+
+    def test_ordinal_season(self):
+        self.assertTrue(check_query_match('house of the dragon 2', 'House of the Dragon 2ª Temporada'))
+
+class EpisodeMatchTest(unittest.TestCase):
+
+    def test_exact_episode(self):
+        self.assertTrue(check_query_match('breaking bad s01e02', 'Breaking.Bad.S01E02.720p'))
+        self.assertFalse(check_query_match('breaking bad s01e02', 'Breaking.Bad.S01E12.720p'))
+        self.assertFalse(check_query_match('lost s01e02', 'Lost.S02E02.720p'))
+        self.assertFalse(check_query_match('show s01e01', 'Show.S01.Complete'))
+
+    def test_episode_range(self):
+        self.assertTrue(check_query_match('lost s01e02', 'Lost.S01E02-03.720p'))
+        self.assertTrue(check_query_match('lost s01e02', 'Lost.S01E02E03.720p'))
+        # A palavra s01e03 não aparece no título: a faixa sozinha não basta
+        self.assertFalse(check_query_match('lost s01e03', 'Lost.S01E02-03.720p'))
+
+    def test_title_has_episode_bounds(self):
+        self.assertTrue(_title_has_episode('S01E01-03', '01', 2))
+        self.assertFalse(_title_has_episode('S01E01-03', '01', 4))
+        self.assertTrue(_title_has_episode('S01E03.E04', '01', 4))
+        self.assertTrue(_title_has_episode('S01E07 08 09', '01', 8))
+        self.assertFalse(_title_has_episode('S02E01', '01', 1))
+
+class FirstTitleWordTest(unittest.TestCase):
+    """Com 2+ palavras, a primeira palavra de título da query precisa estar no título."""
+
+    def test_first_word_required(self):
+        self.assertTrue(check_query_match('batman begins', 'Begins.Batman.2005'))
+        self.assertFalse(check_query_match('batman begins', 'Begins.Again.2005'))
+        self.assertTrue(check_query_match('cidade de deus', 'Cidade.de.Deus.2002'))
+        self.assertFalse(check_query_match('cidade de deus', 'Deus.e.o.Diabo.2002'))
+
+    def test_long_queries(self):
+        self.assertTrue(check_query_match('300 rise of an empire', '300.Rise.of.an.Empire.2014'))
+        self.assertTrue(check_query_match(
+            'the lord of the rings return king', 'The.Lord.of.the.Rings.The.Return.of.the.King'))
+        self.assertFalse(check_query_match(
+            'the lord of the rings return king', 'Return.of.the.King.Documentary'))
+        self.assertTrue(check_query_match('star wars 2019', 'Star.Wars.The.Rise.of.Skywalker.2019'))
+
+    def test_plan(self):
+        plan = get_query_plan('lost s01e02')
+        self.assertEqual(plan.clean_words, ['lost', 's01e02'])
+        self.assertEqual(plan.required_word, 'lost')
+        self.assertEqual(plan.season, 1)
+        self.assertEqual(plan.episode, ('01', 2))
+
+        # Ano é descartado; número curto não conta como palavra de título
+        self.assertEqual(get_query_plan('2001 odisseia espaco').clean_words, ['odisseia', 'espaco'])
+        self.assertEqual(get_query_plan('12 homens').first_title_word, 'homens')
+        self.assertIsNone(get_query_plan('the boys').required_word)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,5 @@
 # Copyright (c) 2025 DFlexy · https://github.com/DFlexy
 
-import json
 import logging
 import threading
 import time
@@ -8,6 +7,7 @@ from typing import List, Optional
 
 import requests
 
+from cache import json_codec
 from cache.redis_client import get_redis_client
 from cache.redis_keys import tracker_list_key, circuit_tracker_key
 from app.config import Config
@@ -35,10 +35,13 @@ def _is_redis_connection_error(error: Exception) -> bool:
     return any(err in error_str for err in connection_errors)
 
 def _log_redis_error(operation: str, error: Exception) -> None:
+    # Evita o str(error).lower() quando DEBUG está desligado
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
     if _is_redis_connection_error(error):
-        logger.debug(f"Redis fallback: {operation}")
+        logger.debug("Redis fallback: %s", operation)
     else:
-        logger.debug(f"Redis error: {operation}")
+        logger.debug("Redis error: %s", operation)
 
 _CIRCUIT_BREAKER_KEY = circuit_tracker_key()
 _CIRCUIT_BREAKER_TIMEOUT_THRESHOLD = 3
@@ -110,7 +113,7 @@ def _record_timeout():
 
     if _request_cache.circuit_breaker['timeout_count'] >= _CIRCUIT_BREAKER_TIMEOUT_THRESHOLD:
         _request_cache.circuit_breaker['disabled'] = True
-        logger.debug(f"Circuit breaker: {_request_cache.circuit_breaker['timeout_count']} timeouts (query atual)")
+        logger.debug("Circuit breaker: %d timeouts (query atual)", _request_cache.circuit_breaker['timeout_count'])
 
 def _record_success():
     """Registra uma requisição bem-sucedida, resetando o contador de timeouts"""
@@ -179,7 +182,7 @@ class TrackerListProvider:
                 cached = self.redis.get(cache_key)
                 if not cached:
                     return None
-                trackers = json.loads(cached.decode("utf-8"))
+                trackers = json_codec.loads(cached)
                 if not trackers:
                     return None
                 trackers_list = list(trackers)
@@ -278,7 +281,7 @@ class TrackerListProvider:
         if self.redis:
             try:
                 cache_key = tracker_list_key()
-                encoded = json.dumps(trackers, separators=(',', ':')).encode("utf-8")
+                encoded = json_codec.dumps(trackers)
                 self.redis.setex(
                     cache_key, 24 * 3600, encoded
                 )
@@ -12,7 +12,7 @@ from cache.redis_keys import tracker_key
 from app.config import Config
 
 from .list_provider import TrackerListProvider
-from .udp_scraper import UDPScraper
+from .udp_scraper import UDPScraper, _uses_socks_proxy
 from .http_scraper import HTTPScraper
 
 logger = logging.getLogger(__name__)
@@ -32,10 +32,39 @@ def _is_redis_connection_error(error: Exception) -> bool:
     return any(err in error_str for err in connection_errors)
 
 def _log_redis_error(operation: str, error: Exception) -> None:
+    # Evita o str(error).lower() quando DEBUG está desligado
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
     if _is_redis_connection_error(error):
-        logger.debug(f"Redis fallback: {operation}")
+        logger.debug("Redis fallback: %s", operation)
     else:
-        logger.debug(f"Redis error: {operation}")
+        logger.debug("Redis error: %s", operation)
+
+def _log_udp_tracker_error(tracker: str, exc: BaseException) -> None:
+    error_msg = str(exc)
+    is_dns_error = (
+        "Temporary failure in name resolution" in error_msg
+        or "[Errno -3]" in error_msg
+        or "[Errno -2]" in error_msg
+        or "[Errno -5]" in error_msg
+        or "No address associated with hostname" in error_msg
+        or "name or service not known" in error_msg.lower()
+        or "Name or service not known" in error_msg
+    )
+    is_timeout_error = (
+        "Timeout" in error_msg
+        or "timeout" in error_msg.lower()
+        or isinstance(exc, TimeoutError)
+    )
+
+    if is_dns_error:
+        logger.debug("Tracker %s: DNS error", tracker)
+    elif is_timeout_error:
+        logger.debug("Tracker %s: timeout", tracker)
+    else:
+        error_type = type(exc).__name__
+        short_msg = error_msg.split('\n')[0][:50]
+        logger.debug("Tracker %s: %s - %s", tracker, error_type, short_msg)
 
 def _sanitize_tracker(url: str) -> Optional[str]:
     if not url:
@@ -202,6 +231,27 @@ class TrackerService:
         if zero_count >= _MAX_ZERO_RESPONSES and best is not None:
             return best
 
+        if len(udp_trackers) > 1 and not _uses_socks_proxy():
+            # Sem proxy SOCKS: todos os trackers UDP em paralelo num único event loop
+            try:
+                udp_results = self._udp_scraper.scrape_many_sync(udp_trackers, info_hash_bytes)
+            except Exception as exc:  # noqa: BLE001
+                udp_results = [exc] * len(udp_trackers)
+            # Mesma contagem de respostas zeradas do caminho sequencial, na ordem dos trackers
+            for tracker, peers in zip(udp_trackers, udp_results):
+                if isinstance(peers, BaseException):
+                    _log_udp_tracker_error(tracker, peers)
+                    continue
+                leechers, seeders = peers
+                if seeders or leechers:
+                    return leechers, seeders
+                if best is None:
+                    best = (leechers, seeders)
+                zero_count += 1
+                if zero_count >= _MAX_ZERO_RESPONSES:
+                    break
+            return best
+
         for tracker in udp_trackers:
             try:
                 peers = self._scrape_single_tracker(
@@ -217,30 +267,7 @@ class TrackerService:
                     if zero_count >= _MAX_ZERO_RESPONSES:
                         break
             except Exception as exc:  # noqa: BLE001
-                error_msg = str(exc)
-                is_dns_error = (
-                    "Temporary failure in name resolution" in error_msg
-                    or "[Errno -3]" in error_msg
-                    or "[Errno -2]" in error_msg
-                    or "[Errno -5]" in error_msg
-                    or "No address associated with hostname" in error_msg
-                    or "name or service not known" in error_msg.lower()
-                    or "Name or service not known" in error_msg
-                )
-                is_timeout_error = (
-                    "Timeout" in error_msg
-                    or "timeout" in error_msg.lower()
-                    or isinstance(exc, TimeoutError)
-                )
-                
-                if is_dns_error:
-                    logger.debug("Tracker %s: DNS error", tracker)
-                elif is_timeout_error:
-                    logger.debug("Tracker %s: timeout", tracker)
-                else:
-                    error_type = type(exc).__name__
-                    short_msg = error_msg.split('\n')[0][:50]
-                    logger.debug("Tracker %s: %s - %s", tracker, error_type, short_msg)
+                _log_udp_tracker_error(tracker, exc)
 
         if best is not None:
             return best
@@ -1,18 +1,60 @@
 # Copyright (c) 2025 DFlexy · https://github.com/DFlexy
 
+import asyncio
+import logging
 import os
-import random
 import socket
 import struct
 import threading
-from typing import Tuple, Optional
+import time
+from typing import Dict, List, Tuple, Optional, Union
+
+logger = logging.getLogger(__name__)
 
 PROTOCOL_ID = 0x41727101980
 ACTION_CONNECT = 0
 ACTION_SCRAPE = 2
+ACTION_ERROR = 3
+
+# Cabeçalho de requisição BEP-15 (CONNECT e SCRAPE): connection_id, action, transaction_id
+_REQUEST_HEADER = struct.Struct(">QLL")
+# Respostas: CONNECT (action, transaction_id, connection_id) e SCRAPE (cabeçalho + contadores)
+_CONNECT_RESP = struct.Struct(">LLQ")
+_SCRAPE_HEADER = struct.Struct(">LL")
+_SCRAPE_COUNTS = struct.Struct(">LLL")
+_RECV_BUFFER_SIZE = 32
+# BEP-15: o cliente pode reutilizar o connection_id por até 1 minuto
+_CONNECTION_ID_TTL = 60.0
+_MAX_POOLED_SOCKETS_PER_TRACKER = 4
 
 def _generate_transaction_id() -> int:
-    return random.randint(0, 0xFFFFFFFF)
+    return int.from_bytes(os.urandom(4), "big")
+
+def _uses_socks_proxy() -> bool:
+    try:
+        from utils.http.proxy import get_proxy_url
+        proxy_url = get_proxy_url()
+        return bool(proxy_url and proxy_url.startswith(('socks5://', 'socks5h://')))
+    except Exception:
+        return False
+
+class _TrackerDatagramProtocol(asyncio.DatagramProtocol):
+    """Entrega os datagramas recebidos de um tracker para quem estiver aguardando."""
+
+    def __init__(self):
+        self._queue: asyncio.Queue = asyncio.Queue()
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        self._queue.put_nowait(data)
+
+    def error_received(self, exc: Exception) -> None:
+        self._queue.put_nowait(exc)
+
+    async def receive(self) -> bytes:
+        item = await self._queue.get()
+        if isinstance(item, Exception):
+            raise item
+        return item
 
 def _create_udp_socket(host: str, port: int) -> socket.socket:
     try:
@@ -38,9 +80,7 @@ def _create_udp_socket(host: str, port: int) -> socket.socket:
             except ImportError:
                 pass
             except Exception as e:
-                import logging
-                logger = logging.getLogger(__name__)
-                logger.debug(f"Erro ao configurar proxy SOCKS5 para UDP: {e}")
+                logger.debug("Erro ao configurar proxy SOCKS5 para UDP: %s", e)
                 pass
     except Exception:
         pass
@@ -52,18 +92,209 @@ class UDPScraper:
         self.timeout = timeout
         self.retries = retries
         self._lock = threading.Lock()
-        random.seed(int.from_bytes(os.urandom(8), "big"))
+        # Buffer de recepção por thread: a instância é compartilhada pelos workers do TrackerService
+        self._recv_local = threading.local()
+        # Sockets reaproveitados e connection_id válidos por tracker (host, port); protegidos por _lock
+        self._sock_pool: Dict[Tuple[str, int], List[socket.socket]] = {}
+        self._conn_id_cache: Dict[Tuple[str, int], Tuple[int, float]] = {}
+
+    def _recv_buffer(self) -> memoryview:
+        recv_mv = getattr(self._recv_local, 'mv', None)
+        if recv_mv is None:
+            recv_mv = memoryview(bytearray(_RECV_BUFFER_SIZE))
+            self._recv_local.mv = recv_mv
+        return recv_mv
 
     def scrape(self, tracker_url: str, info_hash: bytes) -> Tuple[int, int]:
         host, port = self._parse_tracker(tracker_url)
-        sock = _create_udp_socket(host, port)
+        key = (host, port)
+        if _uses_socks_proxy():
+            # Sockets SOCKS5 carregam a associação UDP do proxy: não entram no pool
+            sock = _create_udp_socket(host, port)
+            try:
+                sock.settimeout(self.timeout)
+                sock.bind(("", 0))
+                connection_id = self._connect(sock, host, port)
+                return self._scrape(sock, host, port, connection_id, info_hash)
+            finally:
+                sock.close()
+
+        sock = self._checkout_socket(key)
+        reusable = False
         try:
-            sock.settimeout(self.timeout)
-            sock.bind(("", 0))
+            connection_id = self._get_cached_connection_id(key)
+            if connection_id is not None:
+                try:
+                    result = self._scrape(sock, host, port, connection_id, info_hash)
+                    reusable = True
+                    return result
+                except RuntimeError:
+                    # connection_id recusado pelo tracker: refaz o CONNECT uma vez
+                    self._invalidate_connection_id(key)
+                    self._drain_socket(sock)
             connection_id = self._connect(sock, host, port)
-            return self._scrape(sock, host, port, connection_id, info_hash)
+            self._store_connection_id(key, connection_id)
+            result = self._scrape(sock, host, port, connection_id, info_hash)
+            reusable = True
+            return result
+        finally:
+            if reusable:
+                self._release_socket(key, sock)
+            else:
+                sock.close()
+
+    def _checkout_socket(self, key: Tuple[str, int]) -> socket.socket:
+        with self._lock:
+            pooled = self._sock_pool.get(key)
+            sock = pooled.pop() if pooled else None
+        if sock is not None:
+            # Descarta respostas atrasadas de retransmissões anteriores
+            self._drain_socket(sock)
+            return sock
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.settimeout(self.timeout)
+        sock.bind(("", 0))
+        return sock
+
+    def _release_socket(self, key: Tuple[str, int], sock: socket.socket) -> None:
+        with self._lock:
+            pooled = self._sock_pool.setdefault(key, [])
+            if len(pooled) < _MAX_POOLED_SOCKETS_PER_TRACKER:
+                pooled.append(sock)
+                return
+        sock.close()
+
+    def _drain_socket(self, sock: socket.socket) -> None:
+        recv_mv = self._recv_buffer()
+        sock.setblocking(False)
+        try:
+            while True:
+                sock.recv_into(recv_mv)
+        except (BlockingIOError, InterruptedError):
+            pass
         finally:
-            sock.close()
+            sock.settimeout(self.timeout)
+
+    def _get_cached_connection_id(self, key: Tuple[str, int]) -> Optional[int]:
+        with self._lock:
+            cached = self._conn_id_cache.get(key)
+        if cached is None or cached[1] <= time.monotonic():
+            return None
+        return cached[0]
+
+    def _store_connection_id(self, key: Tuple[str, int], connection_id: int) -> None:
+        with self._lock:
+            self._conn_id_cache[key] = (connection_id, time.monotonic() + _CONNECTION_ID_TTL)
+
+    def _invalidate_connection_id(self, key: Tuple[str, int]) -> None:
+        with self._lock:
+            self._conn_id_cache.pop(key, None)
+
+    def close(self) -> None:
+        """Fecha os sockets mantidos no pool."""
+        with self._lock:
+            pools = list(self._sock_pool.values())
+            self._sock_pool.clear()
+            self._conn_id_cache.clear()
+        for pooled in pools:
+            for sock in pooled:
+                try:
+                    sock.close()
+                except Exception:
+                    pass
+
+    def scrape_many_sync(self, tracker_urls: List[str], info_hash: bytes) -> List[Union[Tuple[int, int], BaseException]]:
+        """Executa scrape_many num event loop próprio, fechado ao final (para chamadores síncronos)."""
+        return asyncio.run(self.scrape_many(tracker_urls, info_hash))
+
+    async def scrape_many(self, tracker_urls: List[str], info_hash: bytes) -> List[Union[Tuple[int, int], BaseException]]:
+        """Faz scrape de todos os trackers em paralelo; retorna (leechers, seeders) ou a exceção por tracker, na ordem recebida."""
+        return await asyncio.gather(
+            *(self._scrape_async(url, info_hash) for url in tracker_urls),
+            return_exceptions=True,
+        )
+
+    async def _scrape_async(self, tracker_url: str, info_hash: bytes) -> Tuple[int, int]:
+        if len(info_hash) != 20:
+            raise ValueError("info_hash deve possuir 20 bytes.")
+        host, port = self._parse_tracker(tracker_url)
+        loop = asyncio.get_running_loop()
+        transport, protocol = await loop.create_datagram_endpoint(
+            _TrackerDatagramProtocol,
+            remote_addr=(host, port),
+            family=socket.AF_INET,
+        )
+        key = (host, port)
+        try:
+            connection_id = self._get_cached_connection_id(key)
+            if connection_id is not None:
+                try:
+                    return await self._scrape_request_async(transport, protocol, connection_id, info_hash)
+                except RuntimeError:
+                    self._invalidate_connection_id(key)
+
+            tid = _generate_transaction_id()
+            packet = _REQUEST_HEADER.pack(PROTOCOL_ID, ACTION_CONNECT, tid)
+            data = await self._request_async(transport, protocol, packet, 16, "CONNECT")
+            connection_id = self._parse_connect_response(data, tid)
+            self._store_connection_id(key, connection_id)
+            return await self._scrape_request_async(transport, protocol, connection_id, info_hash)
+        finally:
+            transport.close()
+
+    async def _scrape_request_async(
+        self,
+        transport: asyncio.DatagramTransport,
+        protocol: _TrackerDatagramProtocol,
+        connection_id: int,
+        info_hash: bytes,
+    ) -> Tuple[int, int]:
+        tid = _generate_transaction_id()
+        packet = _REQUEST_HEADER.pack(connection_id, ACTION_SCRAPE, tid) + info_hash
+        data = await self._request_async(transport, protocol, packet, 20, "SCRAPE")
+        return self._parse_scrape_response(data, tid)
+
+    async def _request_async(
+        self,
+        transport: asyncio.DatagramTransport,
+        protocol: _TrackerDatagramProtocol,
+        packet: bytes,
+        min_length: int,
+        label: str,
+    ) -> bytes:
+        for attempt in range(self.retries + 1):
+            transport.sendto(packet)
+            try:
+                data = await asyncio.wait_for(protocol.receive(), self.timeout)
+            except asyncio.TimeoutError:
+                if attempt >= self.retries:
+                    raise TimeoutError(f"Timeout esperando resposta {label}.")
+                continue
+            if len(data) < min_length:
+                if attempt >= self.retries:
+                    raise RuntimeError(f"Resposta {label} incompleta.")
+                continue
+            return data
+        raise TimeoutError(f"Falha ao obter resposta {label} do tracker.")
+
+    @staticmethod
+    def _parse_connect_response(data, tid: int) -> int:
+        action, resp_tid, connection_id = _CONNECT_RESP.unpack_from(data, 0)
+        if action != ACTION_CONNECT:
+            raise RuntimeError("Ação CONNECT inválida.")
+        if resp_tid != tid:
+            raise RuntimeError("Transaction ID CONNECT divergente.")
+        return connection_id
+
+    @staticmethod
+    def _parse_scrape_response(data, tid: int) -> Tuple[int, int]:
+        action, resp_tid = _SCRAPE_HEADER.unpack_from(data, 0)
+        if resp_tid != tid:
+            raise RuntimeError("Transaction ID SCRAPE divergente.")
+        if action != ACTION_SCRAPE:
+            raise RuntimeError("Ação SCRAPE inválida.")
+        seeders, completed, leechers = _SCRAPE_COUNTS.unpack_from(data, 8)
+        return leechers, seeders
 
     def _parse_tracker(self, tracker_url: str) -> Tuple[str, int]:
         stripped = tracker_url.strip()
@@ -84,23 +315,19 @@ class UDPScraper:
 
     def _connect(self, sock: socket.socket, host: str, port: int) -> int:
         tid = _generate_transaction_id()
-        packet = struct.pack(">QLL", PROTOCOL_ID, ACTION_CONNECT, tid)
+        packet = _REQUEST_HEADER.pack(PROTOCOL_ID, ACTION_CONNECT, tid)
+        recv_mv = self._recv_buffer()
         for attempt in range(self.retries + 1):
             sock.sendto(packet, (host, port))
             try:
-                data, _ = sock.recvfrom(16)
+                nbytes, _ = sock.recvfrom_into(recv_mv, 16)
             except socket.timeout:
                 if attempt >= self.retries:
                     raise TimeoutError("Timeout esperando resposta CONNECT.")
                 continue
-            if len(data) != 16:
+            if nbytes != 16:
                 raise RuntimeError("Resposta CONNECT inválida.")
-            action, resp_tid, connection_id = struct.unpack(">LLQ", data)
-            if action != ACTION_CONNECT:
-                raise RuntimeError("Ação CONNECT inválida.")
-            if resp_tid != tid:
-                raise RuntimeError("Transaction ID CONNECT divergente.")
-            return connection_id
+            return self._parse_connect_response(recv_mv, tid)
         raise TimeoutError("Falha ao conectar ao tracker UDP.")
 
     def _scrape(
@@ -109,27 +336,24 @@ class UDPScraper:
         if len(info_hash) != 20:
             raise ValueError("info_hash deve possuir 20 bytes.")
         tid = _generate_transaction_id()
-        header = struct.pack(">QLL", connection_id, ACTION_SCRAPE, tid)
+        header = _REQUEST_HEADER.pack(connection_id, ACTION_SCRAPE, tid)
         packet = header + info_hash
         expected_length = 8 + 12
+        recv_mv = self._recv_buffer()
         for attempt in range(self.retries + 1):
             sock.sendto(packet, (host, port))
             try:
-                data, _ = sock.recvfrom(expected_length)
+                nbytes, _ = sock.recvfrom_into(recv_mv, expected_length)
             except socket.timeout:
                 if attempt >= self.retries:
                     raise TimeoutError("Timeout esperando resposta SCRAPE.")
                 continue
-            if len(data) < expected_length:
+            if nbytes < expected_length:
+                if nbytes >= 8 and _SCRAPE_HEADER.unpack_from(recv_mv, 0) == (ACTION_ERROR, tid):
+                    raise RuntimeError("Tracker retornou erro no SCRAPE.")
                 if attempt >= self.retries:
                     raise RuntimeError("Resposta SCRAPE incompleta.")
                 continue
-            action, resp_tid = struct.unpack(">LL", data[:8])
-            if resp_tid != tid:
-                raise RuntimeError("Transaction ID SCRAPE divergente.")
-            if action != ACTION_SCRAPE:
-                raise RuntimeError("Ação SCRAPE inválida.")
-            seeders, completed, leechers = struct.unpack(">LLL", data[8:20])
-            return leechers, seeders
+            return self._parse_scrape_response(recv_mv, tid)
         raise TimeoutError("Falha ao obter dados SCRAPE do tracker.")
 
@@ -1,12 +1,38 @@
 # Copyright (c) 2025 DFlexy · https://github.com/DFlexy
 
 import ipaddress
+import logging
 import socket
 from typing import Optional
 from urllib.parse import urlparse
 from app.config import Config
 
+logger = logging.getLogger(__name__)
+
+_cached_proxy_url: Optional[str] = None
+_cached_proxy_dict: Optional[dict] = None
+_proxy_cache_ready = False
+
+def invalidate_proxy_cache() -> None:
+    """Descarta a URL de proxy memoizada (chamar após alterar Config.PROXY_*)."""
+    global _cached_proxy_url, _cached_proxy_dict, _proxy_cache_ready
+    _proxy_cache_ready = False
+    _cached_proxy_url = None
+    _cached_proxy_dict = None
+
 def get_proxy_url() -> Optional[str]:
+    """URL do proxy; Config é estático por processo, então é montada uma vez e memoizada"""
+    global _cached_proxy_url, _cached_proxy_dict, _proxy_cache_ready
+    if _proxy_cache_ready:
+        return _cached_proxy_url
+    
+    proxy_url = _build_proxy_url()
+    _cached_proxy_url = proxy_url
+    _cached_proxy_dict = {'http': proxy_url, 'https': proxy_url} if proxy_url else None
+    _proxy_cache_ready = True
+    return proxy_url
+
+def _build_proxy_url() -> Optional[str]:
     """Monta a URL do proxy a partir das variáveis de ambiente"""
     if not Config.PROXY_HOST or not Config.PROXY_PORT:
         return None
@@ -45,42 +71,52 @@ def is_proxy_enabled() -> bool:
     return get_proxy_url() is not None
 
 def get_proxy_dict() -> Optional[dict]:
-    proxy_url = get_proxy_url()
-    if not proxy_url:
-        return None
-    
-    return {
-        'http': proxy_url,
-        'https': proxy_url
-    }
+    if not _proxy_cache_ready:
+        get_proxy_url()
+    # Cópia: chamadores (requests/session.proxies) podem alterar o dict
+    return dict(_cached_proxy_dict) if _cached_proxy_dict else None
 
 def _aiohttp_proxy_url_and_kwargs(proxy_url: str) -> tuple[str, dict]:
     if proxy_url.startswith('socks5h://'):
         return 'socks5://' + proxy_url[len('socks5h://'):], {'rdns': True}
     return proxy_url, {}
 
+# (classe, usa_url_nativa) do ProxyConnector, resolvida no primeiro uso; False = indisponível
+_proxy_connector_class = None
+
+def _get_proxy_connector_class():
+    global _proxy_connector_class
+    if _proxy_connector_class is None:
+        try:
+            from aiohttp_socks import ProxyConnector
+            _proxy_connector_class = (ProxyConnector, False)
+        except ImportError:
+            try:
+                from aiohttp import ProxyConnector as NativeProxyConnector
+                _proxy_connector_class = (NativeProxyConnector, True)
+            except ImportError:
+                _proxy_connector_class = False
+    return _proxy_connector_class
+
 def get_aiohttp_proxy_connector():
     proxy_url = get_proxy_url()
     if not proxy_url:
         return None
 
-    aiohttp_url, connector_kwargs = _aiohttp_proxy_url_and_kwargs(proxy_url)
+    connector_class = _get_proxy_connector_class()
+    if not connector_class:
+        return None
+    cls, is_native = connector_class
 
     try:
-        from aiohttp_socks import ProxyConnector
-        connector = ProxyConnector.from_url(aiohttp_url, **connector_kwargs)
-        return connector
-    except ImportError:
-        try:
-            from aiohttp import ProxyConnector as NativeProxyConnector
-            connector = NativeProxyConnector.from_url(proxy_url)
-            return connector
-        except Exception:
-            return None
+        if is_native:
+            return cls.from_url(proxy_url)
+        aiohttp_url, connector_kwargs = _aiohttp_proxy_url_and_kwargs(proxy_url)
+        return cls.from_url(aiohttp_url, **connector_kwargs)
     except Exception as e:
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.warning(f"Erro ao criar ProxyConnector: {e}")
+        if is_native:
+            return None
+        logger.warning("Erro ao criar ProxyConnector: %s", e)
         return None
 
 def is_proxy_local() -> bool:
@@ -6,50 +6,70 @@ from typing import Any, Optional
 logger = logging.getLogger(__name__)
 
 def format_error(e: Exception, max_msg_len: int = 100) -> str:
-    error_type = type(e).__name__
-    error_msg = str(e).split('\n')[0][:max_msg_len] if str(e) else ''
-    return f"{error_type} - {error_msg}"
+    error_msg = str(e)
+    if error_msg:
+        error_msg = error_msg.split('\n', 1)[0][:max_msg_len]
+    return f"{type(e).__name__} - {error_msg}"
 
 def format_link_preview(link: Any, max_len: int = 50) -> str:
-    link_str = str(link) if link else 'N/A'
-    if link_str == 'N/A':
+    if not link:
         return 'N/A'
-    preview = link_str[:max_len]
-    return f"{preview}..." if len(link_str) > max_len else link_str
+    link_str = str(link)
+    return f"{link_str[:max_len]}..." if len(link_str) > max_len else link_str
 
 class ScraperLogContext:
+    __slots__ = ('name', 'logger', '_prefix', '_template', '_enabled', '_info', '_warning', '_error', '_debug')
+    
+    _DEBUG = logging.DEBUG
+    _INFO = logging.INFO
+    _WARNING = logging.WARNING
+    _ERROR = logging.ERROR
     
     def __init__(self, scraper_name: str, scraper_logger: Optional[logging.Logger] = None):
         self.name = scraper_name
         self.logger = scraper_logger or logging.getLogger(__name__)
         self._prefix = f"[{scraper_name}]"
+        # Prefixo embutido no template do logging: a junção acontece no getMessage, só se o registro for emitido
+        self._template = self._prefix.replace('%', '%%') + ' %s'
+        # Métodos do logger já vinculados: evita o lookup de self.logger.<nível> a cada chamada
+        self._enabled = self.logger.isEnabledFor
+        self._info = self.logger.info
+        self._warning = self.logger.warning
+        self._error = self.logger.error
+        self._debug = self.logger.debug
     
     def info(self, message: str, *args):
-        formatted = message.format(*args) if args else message
-        self.logger.info(f"{self._prefix} {formatted}")
+        if not self._enabled(self._INFO):
+            return
+        self._info(self._template, message.format(*args) if args else message)
     
     def warning(self, message: str, *args):
-        formatted = message.format(*args) if args else message
-        self.logger.warning(f"{self._prefix} {formatted}")
+        if not self._enabled(self._WARNING):
+            return
+        self._warning(self._template, message.format(*args) if args else message)
     
     def error(self, message: str, *args):
-        formatted = message.format(*args) if args else message
-        self.logger.error(f"{self._prefix} {formatted}")
+        if not self._enabled(self._ERROR):
+            return
+        self._error(self._template, message.format(*args) if args else message)
     
     def debug(self, message: str, *args):
-        formatted = message.format(*args) if args else message
-        self.logger.debug(f"{self._prefix} {formatted}")
+        if not self._enabled(self._DEBUG):
+            return
+        self._debug(self._template, message.format(*args) if args else message)
     
     def error_magnet(self, magnet_link: Any, exception: Exception):
-        link_preview = format_link_preview(magnet_link)
-        self.logger.error(f"Magnet error: {format_error(exception)} (link: {link_preview})")
+        if not self._enabled(self._ERROR):
+            return
+        self._error("Magnet error: %s (link: %s)", format_error(exception), format_link_preview(magnet_link))
     
     def error_document(self, url: Any, exception: Exception):
-        url_preview = format_link_preview(url)
-        self.logger.error(f"Document error: {format_error(exception)} (url: {url_preview})")
+        if not self._enabled(self._ERROR):
+            return
+        self._error("Document error: %s (url: %s)", format_error(exception), format_link_preview(url))
     
     def log_links_found(self, total: int, limit: Optional[int] = None):
         if limit and limit > 0:
-            self.info(f"Encontrados {total} links na página, limitando para {limit}")
+            self.info("Encontrados {} links na página, limitando para {}", total, limit)
         else:
-            self.info(f"Encontrados {total} links na página (sem limite)")
+            self.info("Encontrados {} links na página (sem limite)", total)
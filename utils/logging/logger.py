@@ -1,7 +1,11 @@
 # Copyright (c) 2025 DFlexy · https://github.com/DFlexy
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
+from typing import Optional
 
 class CustomFormatter(logging.Formatter):
     def format(self, record):
@@ -42,6 +46,26 @@ def print_support_banner(log_format: str = 'console') -> None:
         print(line, file=sys.stdout)
     sys.stdout.flush()
 
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+def _install_queue_handler(root_logger: logging.Logger, handler: logging.Handler) -> None:
+    """Logs saem da thread chamadora via fila; o handler real escreve numa thread de fundo."""
+    global _queue_listener
+    
+    if _queue_listener is not None:
+        _queue_listener.stop()
+    
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _queue_listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)
+    _queue_listener.start()
+
+def _stop_queue_listener() -> None:
+    if _queue_listener is not None:
+        _queue_listener.stop()
+
+atexit.register(_stop_queue_listener)
+
 def setup_logging(log_level: int, log_format: str = 'console'):
     python_log_level = _get_log_level_from_numeric(log_level)
     
@@ -60,7 +84,7 @@ def setup_logging(log_level: int, log_format: str = 'console'):
     root_logger = logging.getLogger()
     root_logger.setLevel(python_log_level)
     root_logger.handlers = []
-    root_logger.addHandler(handler)
+    _install_queue_handler(root_logger, handler)
     
     tracker_logger = logging.getLogger('tracker.list_provider')
     tracker_logger.handlers = []
@@ -1,35 +1,71 @@
 # Copyright (c) 2025 DFlexy · https://github.com/DFlexy
 
 import re
+import time
 import logging
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, Dict, Callable
 from bs4 import BeautifulSoup
 
 logger = logging.getLogger(__name__)
 
-def parse_date_from_string(date_str: str) -> Optional[datetime]:
-    patterns = [
-        (r'\d{4}-\d{2}-\d{2}', '%Y-%m-%d'),
+_CURRENT_YEAR_REFRESH = 3600.0
+_current_year_value = datetime.now().year
+_current_year_checked_at = time.monotonic()
+
+def _current_year() -> int:
+    """Ano corrente, revalidado no máximo uma vez por hora."""
+    global _current_year_value, _current_year_checked_at
+    now = time.monotonic()
+    if now - _current_year_checked_at > _CURRENT_YEAR_REFRESH:
+        _current_year_value = datetime.now().year
+        _current_year_checked_at = now
+    return _current_year_value
+
+_ISO_DATE_FMT = '%Y-%m-%d'
+_DATE_PATTERNS = tuple(
+    (re.compile(pattern), fmt)
+    for pattern, fmt in (
+        (r'\d{4}-\d{2}-\d{2}', _ISO_DATE_FMT),
         (r'\d{2}-\d{2}-\d{4}', '%d-%m-%Y'),
         (r'\d{2}/\d{2}/\d{4}', '%d/%m/%Y'),
         (r'\d{1,2},? [A-Za-z]+', '%d, %B'),
         (r'[A-Za-z]+ \d{1,2},? \d{4}', '%B %d, %Y'),
-    ]
-    
-    for pattern, fmt in patterns:
-        match = re.search(pattern, date_str)
+    )
+)
+_YEAR_RE = re.compile(r'\b(19|20)\d{2}\b')
+# Superconjunto de _DATE_PATTERNS e _YEAR_RE: uma varredura descarta strings sem nenhuma data possível
+_DATE_CANDIDATE_RE = re.compile(r'\d{2}[-/]\d{2}|\d,? [A-Za-z]|[A-Za-z] \d|\b(?:19|20)\d{2}\b')
+_RELEASE_YEAR_RE = re.compile(r'(?i)Lan[çc]amentos?\s*[:\-]?\s*(\d{4})')
+_STARCK_LANCAMENTOS_RE = re.compile(r'Lançamentos?\s+\d{4}', re.I)
+_STARCK_YEAR_RE = re.compile(r'(19|20)\d{2}')
+_LANCAMENTO_TEXT_RE = re.compile(r'(?i)Lan[çc]amento')
+_LABEL_INLINE_YEAR_RE = re.compile(r'(?i)Lançamento\s*:?\s*(\d{4})')
+_LABEL_NEXT_YEAR_RE = re.compile(r':?\s*(\d{4})')
+
+def parse_date_from_string(date_str: str) -> Optional[datetime]:
+    if not _DATE_CANDIDATE_RE.search(date_str):
+        return None
+    # O ano corrente entra na chave para o cache não ficar obsoleto na virada do ano
+    return _parse_date_from_string_cached(date_str, _current_year())
+
+@lru_cache(maxsize=8192)
+def _parse_date_from_string_cached(date_str: str, current_year: int) -> Optional[datetime]:
+    for pattern, fmt in _DATE_PATTERNS:
+        match = pattern.search(date_str)
         if match:
             try:
+                if fmt == _ISO_DATE_FMT:
+                    # fromisoformat evita o caminho lento do _strptime
+                    return datetime.fromisoformat(match.group(0))
                 return datetime.strptime(match.group(0), fmt)
             except ValueError:
                 continue
     
-    year_pattern = r'\b(19|20)\d{2}\b'
-    year_match = re.search(year_pattern, date_str)
+    year_match = _YEAR_RE.search(date_str)
     if year_match:
         year = int(year_match.group(0))
-        current_year = datetime.now().year
         if year != current_year:
             return datetime(year, 12, 31)
     
@@ -37,129 +73,131 @@ def parse_date_from_string(date_str: str) -> Optional[datetime]:
 
 def _extract_release_year_starck(doc: BeautifulSoup) -> Optional[int]:
     """Starck: <div>Lançamentos 2025</div>"""
-    lancamentos_div = doc.find('div', string=re.compile(r'Lançamentos?\s+\d{4}', re.I))
+    lancamentos_div = doc.find('div', string=_STARCK_LANCAMENTOS_RE)
     if lancamentos_div:
-        year_match = re.search(r'(19|20)\d{2}', lancamentos_div.get_text())
+        year_match = _STARCK_YEAR_RE.search(lancamentos_div.get_text())
         if year_match:
             year = int(year_match.group(0))
-            current_year = datetime.now().year
-            if year != current_year:
+            if year != _current_year():
                 return year
     return None
 
-def _extract_release_year_tfilme(doc: BeautifulSoup) -> Optional[int]:
-    """Torrent dos Filmes: <b>Lançamento:</b> <a href="...">2025</a><br />"""
-    for b_tag in doc.find_all('b'):
-        b_text = b_tag.get_text(strip=True).lower()
-        if 'lançamento' in b_text or 'lancamento' in b_text:
-            parent = b_tag.parent
-            if parent:
-                parent_html = str(parent)
-                year_match = re.search(r'(?i)Lançamento\s*:?\s*(?:</b>|</strong>)?\s*(?:<a[^>]*>)?\s*(\d{4})', parent_html)
-                if year_match:
-                    year = int(year_match.group(1))
-                    current_year = datetime.now().year
-                    if year != current_year:
-                        return year
+def _label_year_text(label_tag) -> str:
+    """Texto do primeiro irmão não vazio após o rótulo (sem re-serializar o HTML do pai)."""
+    sibling = label_tag.next_sibling
+    while sibling is not None:
+        if isinstance(sibling, str):
+            text = sibling.strip()
+        else:
+            text = sibling.get_text(strip=True)
+        if text:
+            return text
+        sibling = sibling.next_sibling
+    return ''
+
+def _extract_release_year_b_label(doc: BeautifulSoup) -> Optional[int]:
+    """Torrent dos Filmes / Comando: <b>Lançamento:</b> <a href="...">2025</a><br />"""
+    for b_tag in doc.find_all('b', string=_LANCAMENTO_TEXT_RE):
+        year_match = (
+            _LABEL_INLINE_YEAR_RE.search(b_tag.get_text(strip=True))
+            or _LABEL_NEXT_YEAR_RE.match(_label_year_text(b_tag))
+        )
+        if year_match:
+            year = int(year_match.group(1))
+            if year != _current_year():
+                return year
     return None
 
 def _extract_release_year_bludv(doc: BeautifulSoup) -> Optional[int]:
     """Bludv: <span style='...'><strong><em>Lançamento:</em></strong> 2025</span><br />"""
-    for span in doc.find_all('span'):
-        span_html = str(span)
-        if re.search(r'(?i)Lançamento', span_html):
-            year_match = re.search(r'(?i)Lançamento\s*:?\s*(?:</em>|</strong>)?\s*(\d{4})', span_html)
-            if year_match:
-                year = int(year_match.group(1))
-                current_year = datetime.now().year
-                if year != current_year:
-                    return year
-    return None
-
-def _extract_release_year_comand(doc: BeautifulSoup) -> Optional[int]:
-    """Comando: <b>Lançamento:</b> <a href="...">2025</a><br />"""
-    for b_tag in doc.find_all('b'):
-        b_text = b_tag.get_text(strip=True).lower()
-        if 'lançamento' in b_text or 'lancamento' in b_text:
-            parent = b_tag.parent
-            if parent:
-                parent_html = str(parent)
-                year_match = re.search(r'(?i)Lançamento\s*:?\s*(?:</b>|</strong>)?\s*(?:<a[^>]*>)?\s*(\d{4})', parent_html)
-                if year_match:
-                    year = int(year_match.group(1))
-                    current_year = datetime.now().year
-                    if year != current_year:
-                        return year
+    # Parte dos nós de texto com o rótulo e sobe até o <span> que contém o ano
+    for label in doc.find_all(string=_LANCAMENTO_TEXT_RE):
+        span = label.find_parent('span')
+        if span is None:
+            continue
+        year_match = _LABEL_INLINE_YEAR_RE.search(span.get_text())
+        if year_match:
+            year = int(year_match.group(1))
+            if year != _current_year():
+                return year
     return None
 
 def _extract_release_year_rede(doc: BeautifulSoup) -> Optional[int]:
     """Rede: <strong>Lançamento</strong>: 2025<br>"""
-    for strong_tag in doc.find_all('strong'):
-        strong_text = strong_tag.get_text(strip=True).lower()
-        if 'lançamento' in strong_text or 'lancamento' in strong_text:
-            parent = strong_tag.parent
-            if parent:
-                parent_text = parent.get_text()
-                year_match = re.search(r'(?i)Lançamento\s*:?\s*(\d{4})', parent_text)
-                if year_match:
-                    year = int(year_match.group(1))
-                    current_year = datetime.now().year
-                    if year != current_year:
-                        return year
+    for strong_tag in doc.find_all('strong', string=_LANCAMENTO_TEXT_RE):
+        parent = strong_tag.parent
+        if parent:
+            year_match = _LABEL_INLINE_YEAR_RE.search(parent.get_text())
+            if year_match:
+                year = int(year_match.group(1))
+                if year != _current_year():
+                    return year
     return None
 
-SCRAPER_RELEASE_YEAR_EXTRACTORS: Dict[str, Callable[[BeautifulSoup], Optional[int]]] = {
+ReleaseYearExtractor = Callable[[BeautifulSoup], Optional[int]]
+
+SCRAPER_RELEASE_YEAR_EXTRACTORS: Dict[str, ReleaseYearExtractor] = {
     'starck': _extract_release_year_starck,
-    'tfilme': _extract_release_year_tfilme,
+    'tfilme': _extract_release_year_b_label,
     'bludv': _extract_release_year_bludv,
-    'comand': _extract_release_year_comand,
+    'comand': _extract_release_year_b_label,
     'rede': _extract_release_year_rede,
 }
 
-def extract_release_year_from_page(doc: BeautifulSoup, scraper_type: Optional[str] = None) -> Optional[int]:
+def get_release_year_extractor(scraper_type: Optional[str]) -> Optional[ReleaseYearExtractor]:
+    """Regra específica do scraper; resolvida uma vez e guardada na instância do scraper."""
+    if not scraper_type:
+        return None
+    return SCRAPER_RELEASE_YEAR_EXTRACTORS.get(scraper_type)
+
+def extract_release_year_from_page(
+    doc: BeautifulSoup,
+    scraper_type: Optional[str] = None,
+    extractor: Optional[ReleaseYearExtractor] = None,
+) -> Optional[int]:
     """Extrai o ano do campo "Lançamento" do HTML"""
-    if scraper_type and scraper_type in SCRAPER_RELEASE_YEAR_EXTRACTORS:
-        extractor = SCRAPER_RELEASE_YEAR_EXTRACTORS[scraper_type]
+    if extractor is None:
+        extractor = get_release_year_extractor(scraper_type)
+    if extractor is not None:
         try:
             year = extractor(doc)
             if year:
                 return year
         except Exception as e:
-            logger.debug(f"Erro ao extrair ano com regra específica do scraper {scraper_type}: {e}")
+            logger.debug("Erro ao extrair ano com regra específica %s: %s", extractor.__name__, e)
     
-    for extractor in SCRAPER_RELEASE_YEAR_EXTRACTORS.values():
-        try:
-            year = extractor(doc)
-            if year:
-                return year
-        except Exception:
-            continue
-    
-
-    doc_text = doc.get_text()
-    year_match = re.search(r'(?i)Lançamento\s*:?\s*(\d{4})', doc_text)
-    if year_match:
+    # Fallback: uma única passada de regex sobre o texto renderizado cobre os formatos de todos os scrapers
+    current_year = _current_year()
+    for year_match in _RELEASE_YEAR_RE.finditer(doc.get_text(" ", strip=True)):
         year = int(year_match.group(1))
-        current_year = datetime.now().year
         if year != current_year:
             return year
     
     return None
 
-def extract_release_year_date_from_page(doc: BeautifulSoup, scraper_type: Optional[str] = None) -> Optional[datetime]:
+def extract_release_year_date_from_page(
+    doc: BeautifulSoup,
+    scraper_type: Optional[str] = None,
+    extractor: Optional[ReleaseYearExtractor] = None,
+) -> Optional[datetime]:
     """Extrai o ano do campo "Lançamento" e retorna como datetime(YYYY, 12, 31)"""
-    year = extract_release_year_from_page(doc, scraper_type)
+    year = extract_release_year_from_page(doc, scraper_type, extractor)
     if year:
         return datetime(year, 12, 31)
     return None
 
-def extract_date_from_page(doc: BeautifulSoup, url: str, scraper_type: Optional[str] = None) -> Optional[datetime]:
+def extract_date_from_page(
+    doc: BeautifulSoup,
+    url: str,
+    scraper_type: Optional[str] = None,
+    extractor: Optional[ReleaseYearExtractor] = None,
+) -> Optional[datetime]:
     """Extrai data de publicação da URL, meta tags ou campo Lançamento."""
     date = parse_date_from_string(url)
     if date:
         return date
     
-    release_year_date = extract_release_year_date_from_page(doc, scraper_type)
+    release_year_date = extract_release_year_date_from_page(doc, scraper_type, extractor)
     if release_year_date:
         return release_year_date
     
@@ -2,24 +2,31 @@
 
 """Extração de ID IMDb (ttNNNNNNNN) a partir do HTML da página de um post."""
 import re
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Pattern
+import soupsieve
 from bs4 import BeautifulSoup
 from bs4.element import Tag
 
-_RE_IMDB_PT = re.compile(r'imdb\.com/pt/title/(tt\d+)')
-_RE_IMDB = re.compile(r'imdb\.com/title/(tt\d+)')
+# /pt/title e /title numa única alternação; iselect para na primeira âncora com ID
+_RE_IMDB_ANY = re.compile(r'imdb\.com/(?:pt/)?title/(tt\d+)')
+_IMDB_LINK_SELECTOR = soupsieve.compile('a[href*="imdb.com"]')
+_RE_IMDB_LABEL_DEFAULT = re.compile(r'IMDb', re.I)
+
+
+@lru_cache(maxsize=32)
+def _compile_label_regex(label_regex: str) -> Pattern[str]:
+    try:
+        return re.compile(label_regex, re.I)
+    except re.error:
+        return _RE_IMDB_LABEL_DEFAULT
 
 
 def _match_imdb_href(href: str) -> Optional[str]:
     if not href:
         return None
-    m = _RE_IMDB_PT.search(href)
-    if m:
-        return m.group(1)
-    m = _RE_IMDB.search(href)
-    if m:
-        return m.group(1)
-    return None
+    m = _RE_IMDB_ANY.search(href)
+    return m.group(1) if m else None
 
 
 def extract_imdb_from_soup(
@@ -43,28 +50,28 @@ def extract_imdb_from_soup(
     if article is None:
         return imdb
 
-    try:
-        label_re = re.compile(label_regex, re.I)
-    except re.error:
-        label_re = re.compile(r'IMDb', re.I)
+    label_re = _compile_label_regex(label_regex)
 
     for label_name in (label_tag, 'strong', 'b'):
         label_elem = article.find(label_name, string=label_re)
         if label_elem:
             parent = label_elem.parent
             if parent:
-                for a in parent.select('a[href*="imdb.com"]'):
+                for a in _IMDB_LINK_SELECTOR.iselect(parent):
                     imdb = _match_imdb_href(a.get('href', ''))
                     if imdb:
                         return imdb
 
     scan_root = content_div or article
-    for a in scan_root.select('a[href*="imdb.com"]'):
+    for a in _IMDB_LINK_SELECTOR.iselect(scan_root):
         imdb = _match_imdb_href(a.get('href', ''))
         if imdb:
             return imdb
 
-    for a in article.select('a[href*="imdb.com"]'):
+    if scan_root is article:
+        return ''
+
+    for a in _IMDB_LINK_SELECTOR.iselect(article):
         imdb = _match_imdb_href(a.get('href', ''))
         if imdb:
             return imdb
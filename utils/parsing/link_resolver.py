@@ -15,6 +15,7 @@ from typing import Optional, List
 from urllib.parse import urljoin, urlparse, parse_qs, unquote, quote
 from bs4 import BeautifulSoup
 import requests
+import soupsieve
 from cache.redis_client import get_redis_client
 from cache.redis_keys import protlink_key
 
@@ -40,6 +41,12 @@ _DEFAULT_HEADERS = {
 
 _BASE64_CHARS = set(string.ascii_letters + string.digits + '+/=')
 
+_DATA_LINK_ATTRS = ('data-download', 'data-link', 'data-magnet', 'data-url', 'data-u')
+# Seletores que não se reduzem a find_all: compilados uma vez
+_SEL_META_REFRESH = soupsieve.compile('meta[http-equiv="refresh"]')
+_SEL_META_REFRESH_ANY_CASE = soupsieve.compile('meta[http-equiv="refresh"], meta[http-equiv="Refresh"]')
+_SEL_DATA_LINK = soupsieve.compile(', '.join(f'[{attr}]' for attr in _DATA_LINK_ATTRS))
+
 _RE_MAGNET_FULL = re.compile(r'magnet:\?[^"\'\s<>]+')
 _RE_MAGNET_QUOTED = re.compile(r'magnet:\?[^"\'\s\)]+')
 _RE_MAGNET_EXTENDED = re.compile(r'magnet:\?[^"\']+')
@@ -152,12 +159,12 @@ def _make_soup(html_content: str) -> BeautifulSoup:
         return BeautifulSoup(html_content, 'html.parser')
 
 def _extract_magnet_from_html(doc: BeautifulSoup, html_content: str) -> Optional[str]:
-    for a in doc.select('a[href^="magnet:"], a[href*="magnet:"]'):
-        href = a.get('href', '')
+    for a in doc.find_all('a', href=True):
+        href = a['href']
         if href.startswith('magnet:'):
             return href
 
-    for meta in doc.select('meta[http-equiv="refresh"]'):
+    for meta in _SEL_META_REFRESH.select(doc):
         content = meta.get('content', '')
         if 'magnet:' in content:
             match = _RE_MAGNET_QUOTED.search(content)
@@ -168,7 +175,7 @@ def _extract_magnet_from_html(doc: BeautifulSoup, html_content: str) -> Optional
                     magnet = extended.group(0)
                 return magnet
 
-    for script in doc.select('script'):
+    for script in doc.find_all('script'):
         script_text = script.string or ''
         if not script_text:
             continue
@@ -195,8 +202,8 @@ def _extract_magnet_from_html(doc: BeautifulSoup, html_content: str) -> Optional
         if matches:
             return max(matches, key=len)
 
-    for elem in doc.select('[data-download], [data-link], [data-magnet], [data-url], [data-u]'):
-        for attr in ('data-download', 'data-link', 'data-magnet', 'data-url', 'data-u'):
+    for elem in _SEL_DATA_LINK.select(doc):
+        for attr in _DATA_LINK_ATTRS:
             value = elem.get(attr, '')
             if not value:
                 continue
@@ -218,18 +225,24 @@ def _extract_magnet_from_html(doc: BeautifulSoup, html_content: str) -> Optional
     return None
 
 def _find_redirect_in_html(doc: BeautifulSoup, html_content: str, current_url: str) -> Optional[str]:
-    for a in doc.select('a[id*="redirect"], a[id*="Redirect"], a[href*="receber.php"], a[href*="redirecionando"]'):
-        href = a.get('href', '')
-        if href and ('receber.php' in href or 'redirecionando' in href.lower() or 'recebi.php' in href):
+    for a in doc.find_all('a', href=True):
+        href = a['href']
+        if not href:
+            continue
+        # Mesmo conjunto de a[id*="redirect"], a[id*="Redirect"], a[href*="receber.php"], a[href*="redirecionando"]
+        if 'receber.php' in href or 'redirecionando' in href:
+            return href
+        a_id = a.get('id') or ''
+        if ('redirect' in a_id or 'Redirect' in a_id) and ('redirecionando' in href.lower() or 'recebi.php' in href):
             return href
 
-    for meta in doc.select('meta[http-equiv="refresh"], meta[http-equiv="Refresh"]'):
+    for meta in _SEL_META_REFRESH_ANY_CASE.select(doc):
         content = meta.get('content', '')
         match = _RE_META_REFRESH_URL.search(content)
         if match:
             return match.group(1).strip()
 
-    for script in doc.select('script'):
+    for script in doc.find_all('script'):
         script_text = script.string or ''
         if not script_text:
             continue
@@ -250,7 +263,7 @@ def _find_redirect_in_html(doc: BeautifulSoup, html_content: str, current_url: s
         is_go_php_link(current_url) or 'get.php' in current_url or 'seuvideo.xyz' in current_url
     )
     if is_systemads_page:
-        for a in doc.select('a[href]'):
+        for a in doc.find_all('a', href=True):
             href = (a.get('href') or '').strip()
             if not href or href.startswith('#') or href.startswith('javascript:'):
                 continue
@@ -356,6 +369,19 @@ def decode_embedded_go_payload_link(href: str) -> Optional[str]:
         return None
 
 
+_PROTECTED_PATTERNS = (
+    'go.php',
+    'get.php',
+    'links.php',
+    'videosad.net',
+    '?go=',
+    '&go=',
+    'seuvideo.xyz',
+    'protlink',
+    'encurtador',
+    'encurta',
+)
+
 def is_protected_link(href: str, protected_patterns: Optional[List[str]] = None) -> bool:
     if not href:
         return False
@@ -364,19 +390,9 @@ def is_protected_link(href: str, protected_patterns: Optional[List[str]] = None)
     if is_offline_decodable_link(href):
         return True
     if protected_patterns is None:
-        protected_patterns = [
-            'go.php',
-            'get.php',
-            'links.php',
-            'videosad.net',
-            '?go=',
-            '&go=',
-            'seuvideo.xyz',
-            'protlink',
-            'encurtador',
-            'encurta',
-        ]
-    return any(pattern in href.lower() for pattern in protected_patterns)
+        protected_patterns = _PROTECTED_PATTERNS
+    href_lower = href.lower()
+    return any(pattern in href_lower for pattern in protected_patterns)
 
 def _pkcs7_unpad(data: bytes) -> bytes:
     if not data:
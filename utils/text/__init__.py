@@ -2,10 +2,10 @@
 
 from utils.text.constants import STOP_WORDS, RELEASE_CLEAN_REGEX
 from utils.text.cleaning import remove_accents, clean_title
-from utils.text.storage import get_metadata_name
+from utils.text.storage import get_metadata_name, get_metadata_names
 from utils.text.title_builder import prepare_release_title, create_standardized_title
 from utils.text.utils import find_year_from_text, find_sizes_from_text, format_bytes
-from utils.text.query import check_query_match
+from utils.text.query import check_query_match, get_query_plan
 from utils.text.cross_data import (
     get_cross_data_from_redis,
     save_cross_data_to_redis,
@@ -19,6 +19,7 @@ __all__ = [
     'remove_accents',
     'clean_title',
     'get_metadata_name',
+    'get_metadata_names',
     'prepare_release_title',
     'create_standardized_title',
     'find_year_from_text',
@@ -27,6 +28,7 @@ __all__ = [
     'detect_audio_from_html',
     'add_audio_tag_if_needed',
     'check_query_match',
+    'get_query_plan',
     'get_cross_data_from_redis',
     'save_cross_data_to_redis',
 ]
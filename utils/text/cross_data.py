@@ -1,15 +1,62 @@
 # Copyright (c) 2025 DFlexy · https://github.com/DFlexy
 
+import atexit
 import logging
 import json
-from typing import Optional, Dict, Any
+import os
+import queue
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.config import Config
+from cache.http_cache import HTTPLocalCache
 
 logger = logging.getLogger(__name__)
 
+# Leituras repetidas do mesmo hash durante a montagem de um resultado não voltam ao Redis.
+# {} marca "sem cross_data"; gravações invalidam a entrada.
+_local_cache = HTTPLocalCache(ttl=Config.CROSS_DATA_LOCAL_CACHE_TTL, max_size=Config.CROSS_DATA_LOCAL_CACHE_SIZE)
+_local_cache.enabled = _local_cache.enabled and Config.CROSS_DATA_LOCAL_CACHE_TTL > 0
+
+# Gravações fire-and-forget: uma thread daemon junta até 64 itens por pipeline
+_WRITE_BATCH_SIZE = 64
+_write_queue: Optional['queue.SimpleQueue'] = None
+_write_queue_lock = threading.Lock()
+
+def _reset_after_fork() -> None:
+    global _write_queue
+    _local_cache.clear()
+    # A thread de escrita não existe no filho; a próxima gravação cria outra
+    _write_queue = None
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+_BOOL_FIELDS = frozenset((b'missing_dn', b'has_legenda'))
+_INT_FIELDS = frozenset((b'tracker_seed', b'tracker_leech'))
+
+def _decode_cross_value(field: bytes, value: bytes) -> Any:
+    if field in _BOOL_FIELDS:
+        return value.lower() == b'true'
+    if field in _INT_FIELDS:
+        try:
+            return int(value) if value and value != b'N/A' else 0
+        except (ValueError, TypeError):
+            return 0
+    return value.decode('utf-8') if value and value != b'N/A' else None
+
+def decode_cross_data(raw_map: Dict[bytes, bytes]) -> Dict[str, Any]:
+    """Converte o HGETALL cru (bytes) em cross_data tipado, sem decodificar campo a campo antes de comparar."""
+    return {field.decode('utf-8'): _decode_cross_value(field, value) for field, value in (raw_map or {}).items()}
+
 def get_cross_data_from_redis(info_hash: str) -> Optional[Dict[str, Any]]:
     if not info_hash or len(info_hash) != 40:
         return None
     
+    cached = _local_cache.get(info_hash.lower())
+    if cached is not None:
+        return dict(cached) if cached else None
+    
     try:
         from cache.redis_client import get_redis_client
         from cache.redis_keys import torrent_cross_data_key
@@ -22,87 +69,155 @@ def get_cross_data_from_redis(info_hash: str) -> Optional[Dict[str, Any]]:
         key = torrent_cross_data_key(info_hash_lower)
         data = redis.hgetall(key)
         if not data:
+            _local_cache.set(info_hash_lower, {})
             return None
         
-        result = {}
-        for field, value in data.items():
-            field_str = field.decode('utf-8')
-            value_str = value.decode('utf-8')
-            
-            if field_str == 'missing_dn':
-                result[field_str] = value_str.lower() == 'true'
-            elif field_str == 'has_legenda':
-                result[field_str] = value_str.lower() == 'true'
-            elif field_str in ('tracker_seed', 'tracker_leech'):
-                try:
-                    result[field_str] = int(value_str) if value_str and value_str != 'N/A' else 0
-                except (ValueError, TypeError):
-                    result[field_str] = 0
-            else:
-                result[field_str] = value_str if value_str and value_str != 'N/A' else None
+        result = decode_cross_data(data)
         
+        _local_cache.set(info_hash_lower, result)
         if result:
-            return result
+            return dict(result)
     except Exception:
         pass
     
     return None
 
-def save_cross_data_to_redis(info_hash: str, data: Dict[str, Any]) -> None:
-    if not info_hash or len(info_hash) != 40:
-        return
-    
-    if not data:
-        return
+def _serialize_cross_data(data: Dict[str, Any]) -> Dict[str, str]:
+    to_save = {}
+    for field, value in data.items():
+        if value is None:
+            continue
+        
+        if field in ('tracker_seed', 'tracker_leech'):
+            if value != '' and value != 'N/A':
+                if isinstance(value, int):
+                    to_save[field] = str(value)
+                elif isinstance(value, str) and value.strip().isdigit():
+                    to_save[field] = value.strip()
+        else:
+            if isinstance(value, bool):
+                to_save[field] = 'true' if value else 'false'
+            elif isinstance(value, int):
+                to_save[field] = str(value)
+            else:
+                value_str = str(value).strip()
+                if value_str and value_str != 'N/A' and len(value_str) >= 1:
+                    to_save[field] = value_str
+    return to_save
+
+def _cross_data_expire_target(to_save: Dict[str, str], current_ttl: int) -> Optional[int]:
+    """TTL a aplicar após o HSET (None = manter o atual)."""
+    from app.config import Config
     
+    if 'tracker_seed' in to_save or 'tracker_leech' in to_save:
+        if current_ttl == -1 or current_ttl > Config.CROSS_DATA_TTL_WITH_TRACKER:
+            return Config.CROSS_DATA_TTL_WITH_TRACKER
+    else:
+        if current_ttl == -1 or current_ttl < Config.CROSS_DATA_TTL_DEFAULT:
+            return Config.CROSS_DATA_TTL_DEFAULT
+    return None
+
+def save_cross_data_batch(items: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+    """Salva vários (info_hash, data) num pipeline; só dados de tracker leem o TTL e pedem um segundo pipeline de EXPIRE."""
     try:
         from cache.redis_client import get_redis_client
         from cache.redis_keys import torrent_cross_data_key
         
+        pending: List[Tuple[str, Dict[str, str]]] = []
+        saved_hashes: List[str] = []
+        for info_hash, data in items:
+            if not info_hash or len(info_hash) != 40 or not data:
+                continue
+            to_save = _serialize_cross_data(data)
+            if to_save:
+                info_hash_lower = info_hash.lower()
+                _local_cache.delete(info_hash_lower)
+                saved_hashes.append(info_hash_lower)
+                pending.append((torrent_cross_data_key(info_hash_lower), to_save))
+        if not pending:
+            return
+        
         redis = get_redis_client()
         if not redis:
             return
         
-        info_hash_lower = info_hash.lower()
-        key = torrent_cross_data_key(info_hash_lower)
-        
-        to_save = {}
-        for field, value in data.items():
-            if value is None:
-                continue
-            
-            if field in ('tracker_seed', 'tracker_leech'):
-                if value != '' and value != 'N/A':
-                    if isinstance(value, int):
-                        to_save[field] = str(value)
-                    elif isinstance(value, str) and value.strip().isdigit():
-                        to_save[field] = value.strip()
+        pipe = redis.pipeline(transaction=False)
+        has_tracker = []
+        for key, to_save in pending:
+            pipe.hset(key, mapping=to_save)
+            tracker = 'tracker_seed' in to_save or 'tracker_leech' in to_save
+            has_tracker.append(tracker)
+            if tracker:
+                pipe.ttl(key)
             else:
-                if isinstance(value, bool):
-                    to_save[field] = 'true' if value else 'false'
-                elif isinstance(value, int):
-                    to_save[field] = str(value)
-                else:
-                    value_str = str(value).strip()
-                    if value_str and value_str != 'N/A' and len(value_str) >= 1:
-                        to_save[field] = value_str
+                # Sem tracker o alvo é sempre o teto CROSS_DATA_TTL_DEFAULT: EXPIRE direto, sem ler o TTL
+                pipe.expire(key, Config.CROSS_DATA_TTL_DEFAULT)
+        try:
+            replies = pipe.execute()
+        finally:
+            # Invalida de novo após o HSET: uma leitura concorrente entre a primeira
+            # invalidação e o execute pode ter recolocado o valor antigo no cache local
+            for info_hash_lower in saved_hashes:
+                _local_cache.delete(info_hash_lower)
         
-        if not to_save:
-            return
-        
-        redis.hset(key, mapping=to_save)
-        
-        from app.config import Config
-        has_tracker_data = 'tracker_seed' in to_save or 'tracker_leech' in to_save
-        
-        current_ttl = redis.ttl(key)
-        
-        if has_tracker_data:
-            if current_ttl == -1 or current_ttl > Config.CROSS_DATA_TTL_WITH_TRACKER:
-                redis.expire(key, Config.CROSS_DATA_TTL_WITH_TRACKER)
-        else:
-            if current_ttl == -1 or current_ttl < Config.CROSS_DATA_TTL_DEFAULT:
-                redis.expire(key, Config.CROSS_DATA_TTL_DEFAULT)
+        expire_pipe = None
+        for index, (key, to_save) in enumerate(pending):
+            if not has_tracker[index]:
+                continue
+            target = _cross_data_expire_target(to_save, replies[index * 2 + 1])
+            if target is not None:
+                if expire_pipe is None:
+                    expire_pipe = redis.pipeline(transaction=False)
+                expire_pipe.expire(key, target)
+        if expire_pipe is not None:
+            expire_pipe.execute()
     except Exception:
         pass
 
+def save_cross_data_to_redis(info_hash: str, data: Dict[str, Any]) -> None:
+    save_cross_data_batch(((info_hash, data),))
+
+def _drain_write_queue(q: 'queue.SimpleQueue', items: List[Tuple[str, Dict[str, Any]]]) -> None:
+    while len(items) < _WRITE_BATCH_SIZE:
+        try:
+            items.append(q.get_nowait())
+        except queue.Empty:
+            break
+
+def _cross_data_writer(q: 'queue.SimpleQueue') -> None:
+    while True:
+        items = [q.get()]
+        _drain_write_queue(q, items)
+        save_cross_data_batch(items)
+
+def save_cross_data_async(info_hash: str, data: Dict[str, Any]) -> None:
+    """Enfileira a gravação do cross_data sem esperar o Redis (mesma semântica de save_cross_data_to_redis)."""
+    global _write_queue
+    
+    # Leituras feitas antes do flush não podem ver o cross_data anterior no cache local
+    if info_hash:
+        _local_cache.delete(info_hash.lower())
+    
+    q = _write_queue
+    if q is None:
+        with _write_queue_lock:
+            q = _write_queue
+            if q is None:
+                q = queue.SimpleQueue()
+                threading.Thread(target=_cross_data_writer, args=(q,), name='cross-data-writer', daemon=True).start()
+                _write_queue = q
+    q.put((info_hash, data))
+
+def _flush_cross_data_queue() -> None:
+    """Grava o que ainda estiver na fila ao encerrar o processo."""
+    q = _write_queue
+    if q is None:
+        return
+    while True:
+        items: List[Tuple[str, Dict[str, Any]]] = []
+        _drain_write_queue(q, items)
+        if not items:
+            return
+        save_cross_data_batch(items)
+
+atexit.register(_flush_cross_data_queue)
@@ -1,11 +1,12 @@
 # Copyright (c) 2025 DFlexy · https://github.com/DFlexy
 
 import re
-from typing import List, Optional, Set
+from functools import lru_cache
+from typing import List, Optional, Pattern, Set, Tuple
 from urllib.parse import urlparse
 
 from utils.text.constants import STOP_WORDS
-from utils.text.cleaning import remove_accents
+from utils.text.cleaning import ACCENT_TRANSLATION, remove_accents
 
 _RE_YEAR = re.compile(r'\b((?:19|20)\d{2})\b')
 # Sufixo de data em slugs de catálogo (ex.: scarlet-2025-27-05-2026 → remove -27-05-2026)
@@ -27,10 +28,65 @@ _RE_SLUG_TEMPORADA = re.compile(
     r'|(?:^|[-_/])temporada-?(\d{1,2})(?:[-_/]|$)'
     r'|(?:^|[-_/])s(\d{1,2})(?:e\d{1,2})?(?:[-_/]|$)'
 )
+_RE_NON_WORD = re.compile(r'[^\w]', re.UNICODE)
+_RE_WHITESPACE = re.compile(r'\s+')
+# Acentos e '.' → ' ' numa única tabela de str.translate
+_MATCH_TRANSLATION = {**ACCENT_TRANSLATION, ord('.'): ' '}
+_RE_QUERY_EPISODE = re.compile(r'(?i)s(\d{1,2})e(\d{1,2})')
+_RE_EPISODE_NUMBER = re.compile(r'(\d{1,2})')
 # Palavras de season preservadas ao montar variações sem stopwords.
 _SEASON_KEEP_WORDS = frozenset({'temporada', 'season'})
 
 
+@lru_cache(maxsize=16384)
+def _normalize_for_match(text: str) -> str:
+    """Minúsculas, pontos viram espaço, espaços colapsados e sem acentos (o mesmo título volta em várias queries)."""
+    return _RE_WHITESPACE.sub(' ', text.lower().translate(_MATCH_TRANSLATION))
+
+
+@lru_cache(maxsize=1024)
+def _query_words_pattern(words: Tuple[str, ...]) -> Tuple[Pattern[str], Tuple[str, ...]]:
+    """Um único padrão (alternância) para todas as palavras da query.
+
+    Cada palavra casa como palavra inteira ou prefixo de palavra do título. As
+    alternativas vão da mais longa para a mais curta; o grupo que casou indica a palavra.
+    """
+    ordered = tuple(sorted(words, key=len, reverse=True))
+    alternatives = '|'.join(f'({re.escape(w)})' for w in ordered)
+    return re.compile(r'(?<!\w)(?:' + alternatives + ')', re.IGNORECASE | re.UNICODE), ordered
+
+
+def _matched_query_words(words: Tuple[str, ...], text: str) -> Set[str]:
+    pattern, ordered = _query_words_pattern(words)
+    matched = {ordered[m.lastindex - 1] for m in pattern.finditer(text)}
+    # Na mesma posição só a alternativa mais longa é reportada; as mais curtas
+    # que também casariam ali são prefixos dela.
+    for word in words:
+        if word not in matched:
+            lowered = word.lower()
+            if any(found.lower().startswith(lowered) for found in matched):
+                matched.add(word)
+    return matched
+
+
+@lru_cache(maxsize=128)
+def _season_sxx_patterns(season: int) -> Tuple[Pattern[str], Pattern[str]]:
+    padded = f'{season:02d}'
+    bare = str(season)
+    return (
+        re.compile(rf'(?i)(?<![0-9a-z])s{re.escape(padded)}(?![0-9a-z])'),
+        re.compile(rf'(?i)(?<![0-9a-z])s{re.escape(bare)}(?![0-9a-z])'),
+    )
+
+
+@lru_cache(maxsize=128)
+def _episode_patterns(season: str) -> Tuple[Pattern[str], Pattern[str]]:
+    return (
+        re.compile(rf'(?i)s{season}e(\d{{1,2}})(?:[\.\-\sE]|$)'),
+        re.compile(rf'(?i)s{season}e(\d{{1,2}})(?:[\.\-\sE]+(\d{{1,2}}))*'),
+    )
+
+
 def strip_stop_words_keep_season(query: str) -> str:
     """Remove stopwords mas mantém temporada/season (e o restante da query)."""
     if not query or not str(query).strip():
@@ -46,7 +102,7 @@ def extract_query_year(query: str) -> Optional[str]:
     if not query or not query.strip():
         return None
     for word in query.lower().split():
-        clean = re.sub(r'[^\w]', '', word, flags=re.UNICODE)
+        clean = _RE_NON_WORD.sub('', word)
         if clean.isdigit() and len(clean) == 4 and clean.startswith(('19', '20')):
             return clean
     return None
@@ -83,7 +139,7 @@ def extract_query_season(query: str) -> Optional[int]:
     words = q.lower().split()
     trailing = []
     for word in reversed(words):
-        clean = re.sub(r'[^\w]', '', word, flags=re.UNICODE)
+        clean = _RE_NON_WORD.sub('', word)
         if not clean:
             continue
         if clean.isdigit() and len(clean) <= 2:
@@ -94,7 +150,7 @@ def extract_query_season(query: str) -> Optional[int]:
         # Evita tratar ano truncado; só aceita se a query mencionou season-like
         # ou se "temporada"/"season" foram stopwords removíveis (já no STOP_WORDS).
         has_season_hint = any(
-            re.sub(r'[^\w]', '', w, flags=re.UNICODE).lower() in _SEASON_KEEP_WORDS
+            _RE_NON_WORD.sub('', w).lower() in _SEASON_KEEP_WORDS
             for w in words
         )
         if has_season_hint:
@@ -111,8 +167,7 @@ def title_has_season(text: str, season: int) -> bool:
     """True se o texto indica a temporada pedida (Nª Temporada / S0N / season N)."""
     if not text or season is None:
         return False
-    normalized = remove_accents(str(text).lower().replace('.', ' '))
-    normalized = re.sub(r'\s+', ' ', normalized)
+    normalized = _normalize_for_match(str(text))
 
     for m in _RE_TITLE_TEMPORADA.finditer(normalized):
         for g in m.groups():
@@ -124,8 +179,6 @@ def title_has_season(text: str, season: int) -> bool:
             except (TypeError, ValueError):
                 continue
 
-    padded = f'{int(season):02d}'
-    bare = str(int(season))
     for m in _RE_TITLE_SXX.finditer(normalized):
         try:
             if int(m.group(1)) == season:
@@ -134,9 +187,10 @@ def title_has_season(text: str, season: int) -> bool:
             continue
 
     # "3 temporada" / "temporada 3" já cobertos; aceita também "s03" colado.
-    if re.search(rf'(?i)(?<![0-9a-z])s{re.escape(padded)}(?![0-9a-z])', normalized):
+    padded_re, bare_re = _season_sxx_patterns(int(season))
+    if padded_re.search(normalized):
         return True
-    if re.search(rf'(?i)(?<![0-9a-z])s{re.escape(bare)}(?![0-9a-z])', normalized):
+    if bare_re.search(normalized):
         return True
     return False
 
@@ -229,184 +283,177 @@ def filter_urls_by_query_year(
             filtered.append(url)
     return filtered
 
-def check_query_match(query: str, title: str, title_original_html: str = '', title_translated_html: str = '') -> bool:
-    query = str(query) if query is not None else ''
-    title = str(title) if title is not None else ''
-    title_original_html = str(title_original_html) if title_original_html is not None else ''
-    title_translated_html = str(title_translated_html) if title_translated_html is not None else ''
-    
-    if not query or not query.strip():
-        return True
-    
-    query_lower = query.lower().strip()
-    query_words = query_lower.split()
+def _title_has_episode(title: str, query_season: str, query_episode_num: int) -> bool:
+    """True se o título tem SxxEyy (ou faixa de episódios) cobrindo o episódio da query."""
+    title_season_ep_re, episode_re = _episode_patterns(query_season)
+    title_season_ep_match = title_season_ep_re.search(title)
     
-    clean_query_words = []
-    for word in query_words:
-        clean_word = re.sub(r'[^\w]', '', word, flags=re.UNICODE)
-        if len(clean_word) >= 1:
-            if clean_word.isascii() and clean_word.lower() in STOP_WORDS:
-                continue
-            clean_query_words.append(clean_word.lower() if clean_word.isascii() else clean_word)
-    
-    if len(clean_query_words) == 0:
-        return True
-    
-    non_year_words = [w for w in clean_query_words if not (w.isdigit() and len(w) == 4 and w.startswith(('19', '20')))]
-    if non_year_words:
-        clean_query_words = non_year_words
-    
-    first_title_word = None
-    for word in clean_query_words:
-        if not word.isdigit():
-            first_title_word = word
-            break
-        elif len(word) >= 3:
-            first_title_word = word
-            break
-    
-    combined_title = f"{title} {title_original_html} {title_translated_html}".lower()
-    combined_title = combined_title.replace('.', ' ')
-    combined_title = re.sub(r'\s+', ' ', combined_title)
+    if not title_season_ep_match:
+        return False
     
-    combined_title = remove_accents(combined_title)
-
-    query_season = extract_query_season(query)
-    if query_season is not None and not title_has_season(combined_title, query_season):
+    episode_match = episode_re.search(title)
+    if not episode_match:
         return False
 
-    query_episode_match = re.search(r'(?i)s(\d{1,2})e(\d{1,2})', query)
-    if query_episode_match:
-        query_season = query_episode_match.group(1).zfill(2)
-        query_episode_num = int(query_episode_match.group(2))
-        
-        title_season_ep_pattern = rf'(?i)s{query_season}e(\d{{1,2}})(?:[\.\-\sE]|$)'
-        title_season_ep_match = re.search(title_season_ep_pattern, title)
-        
-        if not title_season_ep_match:
-            return False
-        
-        episode_pattern = rf'(?i)s{query_season}e(\d{{1,2}})(?:[\.\-\sE]+(\d{{1,2}}))*'
-        episode_match = re.search(episode_pattern, title)
-        episodes_in_title = []
-        
-        if episode_match:
-            first_ep = int(episode_match.group(1))
-            episodes_in_title = [first_ep]
-            
-            match_text = episode_match.group(0)
-            first_ep_str = episode_match.group(1)
-            remaining_text = match_text[len(f's{query_season}e{first_ep_str}'):]
-            episode_numbers = re.findall(r'(\d{1,2})', remaining_text)
-            
-            for ep_str in episode_numbers:
-                try:
-                    ep_num = int(ep_str)
-                    if ep_num > episodes_in_title[-1]:
-                        episodes_in_title.append(ep_num)
-                except (ValueError, TypeError):
-                    break
-        else:
-            return False
-        
-        if len(episodes_in_title) == 1:
-            if episodes_in_title[0] != query_episode_num:
-                return False
-        else:
-            if query_episode_num not in episodes_in_title:
-                if len(episodes_in_title) >= 2:
-                    start_ep = episodes_in_title[0]
-                    end_ep = episodes_in_title[-1]
-                    if not (start_ep <= query_episode_num <= end_ep):
-                        return False
-                else:
-                    return False
-    
-    title_normalized = combined_title
-    
-    matches = 0
-    matched_words = []
-    first_title_word_matched = False
-    
-    for query_word in clean_query_words:
-        query_word_normalized = remove_accents(query_word)
-        
-        pattern = r'\b' + re.escape(query_word_normalized) + r'\b'
-        if re.search(pattern, title_normalized, re.IGNORECASE | re.UNICODE):
-            matches += 1
-            matched_words.append(query_word)
-            if query_word == first_title_word:
-                first_title_word_matched = True
-            continue
-        
-        partial_pattern = r'\b' + re.escape(query_word_normalized) + r'(?=\w)'
-        if re.search(partial_pattern, title_normalized, re.IGNORECASE | re.UNICODE):
-            matches += 1
-            matched_words.append(query_word)
-            if query_word == first_title_word:
-                first_title_word_matched = True
-            continue
+    # Episódios do título são crescentes: basta o primeiro e o último da faixa
+    first_ep_str = episode_match.group(1)
+    first_ep = last_ep = int(first_ep_str)
+    remaining_text = episode_match.group(0)[len(f's{query_season}e{first_ep_str}'):]
+    for ep_str in _RE_EPISODE_NUMBER.findall(remaining_text):
+        ep_num = int(ep_str)
+        if ep_num > last_ep:
+            last_ep = ep_num
 
-        if query_word_normalized.isdigit():
-            season_patterns = [f"s{query_word_normalized}", f"s{query_word_normalized.zfill(2)}"]
-            if any(sp in title_normalized for sp in season_patterns):
-                matches += 1
-                matched_words.append(query_word)
+    return first_ep <= query_episode_num <= last_ep
 
-    if len(clean_query_words) > 1 and first_title_word and not first_title_word_matched:
-        return False
-    
 
+class QueryPlan:
+    """Query pré-processada uma vez (palavras, temporada, episódio) para casar com vários títulos."""
+
+    __slots__ = ('clean_words', 'normalized_words', 'unique_words', 'first_title_word', 'required_word', 'season', 'episode')
+
+    def __init__(self, query: str):
+        self.clean_words: List[str] = []
+        self.normalized_words: List[str] = []
+        self.unique_words: Tuple[str, ...] = ()
+        self.first_title_word: Optional[str] = None
+        # Com 2+ palavras, a primeira palavra de título precisa casar (normalizada)
+        self.required_word: Optional[str] = None
+        self.season: Optional[int] = None
+        self.episode: Optional[Tuple[str, int]] = None
+
+        if not query or not query.strip():
+            return
+
+        clean_query_words = []
+        for word in query.lower().strip().split():
+            clean_word = _RE_NON_WORD.sub('', word)
+            if len(clean_word) >= 1:
+                if clean_word.isascii() and clean_word.lower() in STOP_WORDS:
+                    continue
+                clean_query_words.append(clean_word.lower() if clean_word.isascii() else clean_word)
+
+        if len(clean_query_words) == 0:
+            return
 
+        non_year_words = [w for w in clean_query_words if not (w.isdigit() and len(w) == 4 and w.startswith(('19', '20')))]
+        if non_year_words:
+            clean_query_words = non_year_words
 
-    if len(clean_query_words) == 1:
-        return matches == 1
-    elif len(clean_query_words) == 2:
-        return matches == 2
-    else:
-        has_title_match = False
-        for word in matched_words:
+        for word in clean_query_words:
             if not word.isdigit():
-                has_title_match = True
+                self.first_title_word = word
                 break
             elif len(word) >= 3:
-                has_title_match = True
+                self.first_title_word = word
                 break
-        
-        total_words = len(clean_query_words)
-        if total_words >= 5:
-            first_words_to_check = clean_query_words[:min(4, total_words)]
-            first_words_matches = sum(1 for w in first_words_to_check if w in matched_words)
-            
-            min_matches_percent = max(2, int(total_words * 0.3))
-            if first_words_matches >= 2 or matches >= min_matches_percent:
-                return has_title_match
-            
+
+        self.clean_words = clean_query_words
+        self.normalized_words = [remove_accents(w) for w in clean_query_words]
+        self.unique_words = tuple(dict.fromkeys(self.normalized_words))
+        if len(clean_query_words) > 1 and self.first_title_word:
+            self.required_word = remove_accents(self.first_title_word)
+        self.season = extract_query_season(query)
+
+        query_episode_match = _RE_QUERY_EPISODE.search(query)
+        if query_episode_match:
+            self.episode = (query_episode_match.group(1).zfill(2), int(query_episode_match.group(2)))
+
+    def match(self, title: str, title_original_html: str = '', title_translated_html: str = '') -> bool:
+        clean_query_words = self.clean_words
+        if len(clean_query_words) == 0:
+            return True
+
+        title = str(title) if title is not None else ''
+        title_original_html = str(title_original_html) if title_original_html is not None else ''
+        title_translated_html = str(title_translated_html) if title_translated_html is not None else ''
+
+        combined_title = _normalize_for_match(f"{title} {title_original_html} {title_translated_html}")
+
+        if self.season is not None and not title_has_season(combined_title, self.season):
+            return False
+
+        if self.episode is not None and not _title_has_episode(title, *self.episode):
+            return False
+
+        title_normalized = combined_title
+
+        found_words = _matched_query_words(self.unique_words, title_normalized)
+        if self.required_word is not None and self.required_word not in found_words:
             return False
         
-        title_words_in_query = [w for w in clean_query_words if not w.isdigit() or len(w) >= 3]
-        title_words_count = len(title_words_in_query)
-        
-        title_word_matches = sum(1 for w in matched_words if not w.isdigit() or len(w) >= 3)
+        matches = 0
+        matched_words = []
         
-        season_match_count = 0
-        for word in clean_query_words:
-            if word.isdigit() and len(word) <= 2:
-                season_patterns = [f"s{word}", f"s{word.zfill(2)}"]
+        for query_word, query_word_normalized in zip(clean_query_words, self.normalized_words):
+            if query_word_normalized in found_words:
+                matches += 1
+                matched_words.append(query_word)
+                continue
+
+            if query_word_normalized.isdigit():
+                season_patterns = [f"s{query_word_normalized}", f"s{query_word_normalized.zfill(2)}"]
                 if any(sp in title_normalized for sp in season_patterns):
-                    season_match_count += 1
-        
-        total_valid_matches = title_word_matches + season_match_count
-        
-        if total_words == 3:
-            if total_valid_matches < title_words_count:
-                return False
-            return True
-        
-        if total_words == 4:
-            if total_valid_matches < 3:
+                    matches += 1
+                    matched_words.append(query_word)
+
+        if len(clean_query_words) == 1:
+            return matches == 1
+        elif len(clean_query_words) == 2:
+            return matches == 2
+        else:
+            has_title_match = False
+            for word in matched_words:
+                if not word.isdigit():
+                    has_title_match = True
+                    break
+                elif len(word) >= 3:
+                    has_title_match = True
+                    break
+            
+            total_words = len(clean_query_words)
+            if total_words >= 5:
+                first_words_to_check = clean_query_words[:min(4, total_words)]
+                first_words_matches = sum(1 for w in first_words_to_check if w in matched_words)
+                
+                min_matches_percent = max(2, int(total_words * 0.3))
+                if first_words_matches >= 2 or matches >= min_matches_percent:
+                    return has_title_match
+                
                 return False
-            return True
-        
-        return matches >= 2 and has_title_match
+            
+            title_words_in_query = [w for w in clean_query_words if not w.isdigit() or len(w) >= 3]
+            title_words_count = len(title_words_in_query)
+            
+            title_word_matches = sum(1 for w in matched_words if not w.isdigit() or len(w) >= 3)
+            
+            season_match_count = 0
+            for word in clean_query_words:
+                if word.isdigit() and len(word) <= 2:
+                    season_patterns = [f"s{word}", f"s{word.zfill(2)}"]
+                    if any(sp in title_normalized for sp in season_patterns):
+                        season_match_count += 1
+            
+            total_valid_matches = title_word_matches + season_match_count
+            
+            if total_words == 3:
+                if total_valid_matches < title_words_count:
+                    return False
+                return True
+            
+            if total_words == 4:
+                if total_valid_matches < 3:
+                    return False
+                return True
+            
+            return matches >= 2 and has_title_match
+
+
+@lru_cache(maxsize=1024)
+def get_query_plan(query: str) -> QueryPlan:
+    return QueryPlan(query)
 
+
+def check_query_match(query: str, title: str, title_original_html: str = '', title_translated_html: str = '') -> bool:
+    query = str(query) if query is not None else ''
+    return get_query_plan(query).match(title, title_original_html, title_translated_html)
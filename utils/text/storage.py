@@ -1,50 +1,71 @@
 # Copyright (c) 2025 DFlexy · https://github.com/DFlexy
 
+import logging
 import re
-from typing import Optional, Dict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from app.config import Config
+from cache import json_codec
+from cache.metadata_cache import MetadataCache
+from cache.redis_client import get_redis_client
+from cache.redis_keys import (
+    metadata_failure503_key,
+    metadata_failure_key,
+    metadata_key,
+    release_title_key,
+    torrent_cross_data_key,
+)
+from magnet.metadata import fetch_metadata_from_itorrents
+from utils.text.cross_data import (
+    decode_cross_data,
+    get_cross_data_from_redis,
+    save_cross_data_async,
+    save_cross_data_to_redis,
+)
+
+logger = logging.getLogger(__name__)
+
+_metadata_cache = None
+
+def _meta_cache():
+    """MetadataCache único do módulo; recriado só quando o cliente Redis muda (reconexão/queda)."""
+    global _metadata_cache
+    redis = get_redis_client()
+    if _metadata_cache is None or _metadata_cache.redis is not redis:
+        _metadata_cache = MetadataCache()
+    return _metadata_cache
 
 def get_release_title_from_redis(info_hash: str) -> Optional[str]:
-    from app.config import Config
     if not info_hash or len(info_hash) != Config.INFO_HASH_LENGTH:
         return None
     
     try:
-        from cache.redis_client import get_redis_client
-        from cache.redis_keys import release_title_key
-        
         redis = get_redis_client()
         if not redis:
             return None
         
-        key = release_title_key(info_hash)
-        cached = redis.get(key)
-        if cached:
-            release_title = cached.decode('utf-8').strip()
-            if release_title and len(release_title) >= 3:
-                return release_title
+        return _decode_release_title(redis.get(release_title_key(info_hash)))
     except Exception:
         pass
     
     return None
 
 def save_release_title_to_redis(info_hash: str, release_title: str) -> None:
-    if not info_hash or len(info_hash) != 40:
+    if not info_hash or len(info_hash) != Config.INFO_HASH_LENGTH:
         return
     
-    if not release_title or len(release_title.strip()) < 3:
+    release_title = (release_title or '').strip()
+    if len(release_title) < 3:
         return
     
     try:
-        from cache.redis_client import get_redis_client
-        from cache.redis_keys import release_title_key
-        
         redis = get_redis_client()
         if not redis:
             return
         
         key = release_title_key(info_hash)
-        from app.config import Config
-        redis.setex(key, Config.RELEASE_TITLE_CACHE_TTL, release_title.strip())
+        redis.setex(key, Config.RELEASE_TITLE_CACHE_TTL, release_title)
     except Exception:
         pass
 
@@ -67,6 +88,15 @@ def is_release_title_incomplete(title: str) -> bool:
         return True
     return False
 
+_TECHNICAL_INDICATORS = (
+    's01e', 's02e', 's03e', 's04e', 's05e',
+    '1080p', '720p', '480p', '2160p', '4k',
+    'x264', 'x265', 'hevc', 'h.264', 'h.265',
+    'web-dl', 'webrip', 'bluray', 'bdrip',
+    'dual', 'dublado', 'legendado'
+)
+
+@lru_cache(maxsize=4096)
 def _is_metadata_more_complete(metadata_name: str, cross_magnet_processed: str) -> bool:
     """Compara se metadata['name'] tem mais informações técnicas que cross_data['magnet_processed']"""
     if not metadata_name or not cross_magnet_processed:
@@ -74,25 +104,26 @@ def _is_metadata_more_complete(metadata_name: str, cross_magnet_processed: str)
     
     metadata_lower = metadata_name.lower()
     cross_lower = cross_magnet_processed.lower()
-    
-    technical_indicators = [
-        's01e', 's02e', 's03e', 's04e', 's05e',
-        '1080p', '720p', '480p', '2160p', '4k',
-        'x264', 'x265', 'hevc', 'h.264', 'h.265',
-        'web-dl', 'webrip', 'bluray', 'bdrip',
-        'dual', 'dublado', 'legendado'
-    ]
-    
-    metadata_count = sum(1 for indicator in technical_indicators if indicator in metadata_lower)
-    cross_count = sum(1 for indicator in technical_indicators if indicator in cross_lower)
-    
-    if metadata_count > cross_count:
+    # Um contido no outro: todo indicador do menor também está no maior
+    if cross_lower in metadata_lower and len(metadata_name) > len(cross_magnet_processed):
         return True
+    if metadata_lower in cross_lower and len(metadata_name) <= len(cross_magnet_processed):
+        return False
     
-    if metadata_count == cross_count and len(metadata_name) > len(cross_magnet_processed):
-        return True
+    metadata_count = cross_count = 0
+    remaining = len(_TECHNICAL_INDICATORS)
+    for indicator in _TECHNICAL_INDICATORS:
+        remaining -= 1
+        metadata_count += indicator in metadata_lower
+        cross_count += indicator in cross_lower
+        # Para assim que o lado atrás não consegue mais empatar
+        if metadata_count - cross_count > remaining:
+            return True
+        if cross_count - metadata_count > remaining:
+            return False
     
-    return False
+    # Empate nos indicadores: desempata pelo comprimento
+    return len(metadata_name) > len(cross_magnet_processed)
 
 def _looks_like_bludv_processed_release_name(name: str) -> bool:
     """Detecta título normalizado do Bludv (-S02E05-1080P-.MKV....) — não é o name do .torrent."""
@@ -157,7 +188,6 @@ def get_raw_torrent_name(info_hash: str, skip_metadata: bool = False) -> Optiona
         return None
 
     try:
-        from utils.text.cross_data import get_cross_data_from_redis
         cross_data = get_cross_data_from_redis(info_hash)
         if cross_data:
             for key in ('metadata_name', 'magnet_original'):
@@ -174,8 +204,7 @@ def get_raw_torrent_name(info_hash: str, skip_metadata: bool = False) -> Optiona
         pass
 
     try:
-        from cache.metadata_cache import MetadataCache
-        cached = MetadataCache().get(info_hash.lower())
+        cached = _meta_cache().get(info_hash.lower())
         if cached and cached.get('name'):
             name = str(cached['name']).strip()
             if name and len(name) >= 3 and not _looks_like_bludv_processed_release_name(name):
@@ -184,99 +213,181 @@ def get_raw_torrent_name(info_hash: str, skip_metadata: bool = False) -> Optiona
         pass
 
     try:
-        from magnet.metadata import fetch_metadata_from_itorrents
         metadata = fetch_metadata_from_itorrents(info_hash)
         if metadata and metadata.get('name'):
             name = str(metadata['name']).strip()
             if name and len(name) >= 3:
-                try:
-                    from utils.text.cross_data import save_cross_data_to_redis
-                    save_cross_data_to_redis(info_hash, {'metadata_name': name, 'magnet_original': name})
-                except Exception:
-                    pass
+                save_cross_data_to_redis(info_hash, {'metadata_name': name, 'magnet_original': name})
                 return name
     except Exception:
         pass
 
     return None
 
-def get_metadata_name(info_hash: str, skip_metadata: bool = False) -> Optional[str]:
-    if skip_metadata:
+def _decode_release_title(raw: Optional[bytes]) -> Optional[str]:
+    if not raw:
         return None
-    
     try:
-        release_title = get_release_title_from_redis(info_hash)
-        if release_title and len(release_title.strip()) >= 3:
-            return release_title.strip()
+        release_title = raw.decode('utf-8').strip()
+    except UnicodeDecodeError:
+        return None
+    if release_title and len(release_title) >= 3:
+        return release_title
+    return None
+
+NameSources = Tuple[Optional[str], Optional[Dict[str, Any]], Optional[Dict[str, Any]]]
+
+def _fetch_name_sources(info_hashes: List[str]) -> Dict[str, NameSources]:
+    """(release_title, cross_data, metadata) de cada hash num único round-trip ao Redis.
+
+    Um pipeline com MGET de release:title, MGET de metadata e um HGETALL por cross_data.
+    Sem Redis, só o metadata do cache por thread do MetadataCache pode existir.
+    Espera hashes já em minúsculo (get_metadata_names normaliza na entrada).
+    """
+    hashes = [h for h in dict.fromkeys(info_hashes) if h]
+    sources: Dict[str, NameSources] = {h: (None, None, None) for h in hashes}
+    if not hashes:
+        return sources
+
+    redis = get_redis_client()
+    if not redis:
+        try:
+            metadata_cache = _meta_cache()
+            for h in hashes:
+                sources[h] = (None, None, metadata_cache.get(h))
+        except Exception:
+            pass
+        return sources
+
+    valid = [h for h in hashes if len(h) == Config.INFO_HASH_LENGTH]
+    try:
+        pipe = redis.pipeline(transaction=False)
+        pipe.mget([metadata_key(h) for h in hashes])
+        if valid:
+            pipe.mget([release_title_key(h) for h in valid])
+            for h in valid:
+                pipe.hgetall(torrent_cross_data_key(h))
+        rows = pipe.execute()
     except Exception:
-        pass
+        return sources
+
+    raw_releases = dict(zip(valid, rows[1])) if valid else {}
+    raw_cross = dict(zip(valid, rows[2:]))
+    for h, raw_meta in zip(hashes, rows[0]):
+        release_title = None
+        cross_data = None
+        if h in raw_releases:
+            release_title = _decode_release_title(raw_releases[h])
+            try:
+                cross_data = decode_cross_data(raw_cross[h]) or None
+            except UnicodeDecodeError:
+                pass
+
+        metadata = None
+        if raw_meta:
+            try:
+                metadata = json_codec.loads(raw_meta)
+            except Exception as e:
+                logger.warning("[MetadataCache] Erro ao decodificar JSON: %.16s... - %s", h, e)
+        sources[h] = (release_title, cross_data, metadata)
+    return sources
+
+def _pick_metadata_name(
+    sources: NameSources,
+    writebacks: List[Tuple[str, Dict[str, Any]]],
+    info_hash: str,
+) -> Optional[str]:
+    """Prioridade: release:title > cross_data.metadata_name > metadata/cross_data.magnet_processed.
+
+    Quando o metadata vence, o cross_data a regravar vai para `writebacks`.
+    """
+    release_title, cross_data, cached_metadata = sources
+    if release_title:
+        return release_title
     
     cross_data_magnet_processed = None
-    try:
-        from utils.text.cross_data import get_cross_data_from_redis
-        cross_data = get_cross_data_from_redis(info_hash)
-        if cross_data:
-            if cross_data.get('metadata_name'):
-                metadata_name = str(cross_data.get('metadata_name')).strip()
-                if metadata_name and metadata_name != 'N/A' and len(metadata_name) >= 3:
-                    return metadata_name
-            
-            if cross_data.get('magnet_processed'):
-                candidate = str(cross_data.get('magnet_processed')).strip()
-                if candidate and candidate != 'N/A' and len(candidate) >= 3:
-                    cross_data_magnet_processed = candidate
-    except Exception:
-        pass
+    if cross_data:
+        value = cross_data.get('metadata_name')
+        if value:
+            metadata_name = str(value).strip()
+            if len(metadata_name) >= 3 and metadata_name != 'N/A':
+                return metadata_name
+        
+        value = cross_data.get('magnet_processed')
+        if value:
+            candidate = str(value).strip()
+            if len(candidate) >= 3 and candidate != 'N/A':
+                cross_data_magnet_processed = candidate
     
-    try:
-        from cache.metadata_cache import MetadataCache
-        metadata_cache = MetadataCache()
-        cached_metadata = metadata_cache.get(info_hash.lower())
-        if cached_metadata and cached_metadata.get('name'):
-            metadata_name = cached_metadata.get('name', '').strip()
-            if metadata_name and len(metadata_name) >= 3:
-                if cross_data_magnet_processed:
-                    if _is_metadata_more_complete(metadata_name, cross_data_magnet_processed):
-                        try:
-                            from utils.text.cross_data import save_cross_data_to_redis
-                            from utils.text.title_builder import _normalize_metadata_name
-                            
-                            normalized_metadata = _normalize_metadata_name(metadata_name)
-                            
-                            save_cross_data_to_redis(info_hash, {'metadata_name': metadata_name, 'magnet_processed': normalized_metadata})
-                        except Exception:
-                            pass
-                        return metadata_name
-                    else:
-                        return cross_data_magnet_processed
-                else:
-                    try:
-                        from utils.text.cross_data import save_cross_data_to_redis
-                        from utils.text.title_builder import _normalize_metadata_name
-                        
-                        normalized_metadata = _normalize_metadata_name(metadata_name)
-                        
-                        save_cross_data_to_redis(info_hash, {'metadata_name': metadata_name, 'magnet_processed': normalized_metadata})
-                    except Exception:
-                        pass
-                    return metadata_name
-    except Exception:
-        pass
+    metadata_name = cached_metadata.get('name') if isinstance(cached_metadata, dict) else None
+    if not isinstance(metadata_name, str):
+        return cross_data_magnet_processed
     
-    if cross_data_magnet_processed:
+    metadata_name = metadata_name.strip()
+    if len(metadata_name) < 3:
+        return cross_data_magnet_processed
+    if cross_data_magnet_processed and not _is_metadata_more_complete(metadata_name, cross_data_magnet_processed):
         return cross_data_magnet_processed
     
     try:
-        from magnet.metadata import fetch_metadata_from_itorrents
-        metadata = fetch_metadata_from_itorrents(info_hash)
-        if metadata and metadata.get('name'):
-            name = metadata.get('name', '').strip()
-            if name and len(name) >= 3:
-                return name
+        from utils.text.title_builder import _normalize_metadata_name
+        
+        writebacks.append((info_hash, {'metadata_name': metadata_name, 'magnet_processed': _normalize_metadata_name(metadata_name)}))
     except Exception:
         pass
+    return metadata_name
+
+def _cached_metadata_failures(info_hashes: List[str]) -> Set[str]:
+    """Hashes com falha recente do iTorrents em cache (metadata:failure*), num único pipeline."""
+    redis = get_redis_client()
+    if not redis or not info_hashes:
+        return set()
+    try:
+        pipe = redis.pipeline(transaction=False)
+        for h in info_hashes:
+            pipe.exists(metadata_failure503_key(h), metadata_failure_key(h))
+        return {h for h, count in zip(info_hashes, pipe.execute()) if count}
+    except Exception:
+        return set()
+
+def get_metadata_names(info_hashes: List[str], skip_metadata: bool = False) -> Dict[str, Optional[str]]:
+    """get_metadata_name de vários hashes: uma leitura em lote no Redis; regravações do cross_data em segundo plano."""
+    names: Dict[str, Optional[str]] = {}
+    if skip_metadata:
+        return {h: None for h in info_hashes}
     
-    return None
+    # Chaves do Redis são em minúsculo; o resultado mantém o hash como veio
+    lowered = {h: h.lower() for h in dict.fromkeys(info_hashes)}
+    sources = _fetch_name_sources(list(lowered.values()))
+    writebacks: List[Tuple[str, Dict[str, Any]]] = []
+    for h, h_lower in lowered.items():
+        names[h] = _pick_metadata_name(sources.get(h_lower, (None, None, None)), writebacks, h_lower)
+    
+    # Regravação do cross_data não bloqueia quem pediu o nome
+    for h, data in writebacks:
+        save_cross_data_async(h, data)
+    
+    missing = [h for h, name in names.items() if not name]
+    # Falha em cache: fetch_metadata_from_itorrents devolveria None depois de várias leituras no Redis por hash
+    failed = _cached_metadata_failures(missing)
+    for h in missing:
+        if h in failed:
+            continue
+        try:
+            metadata = fetch_metadata_from_itorrents(h)
+            if metadata and metadata.get('name'):
+                name = metadata.get('name', '').strip()
+                if name and len(name) >= 3:
+                    names[h] = name
+        except Exception:
+            pass
+    
+    return names
+
+def get_metadata_name(info_hash: str, skip_metadata: bool = False) -> Optional[str]:
+    if skip_metadata:
+        return None
+    return get_metadata_names([info_hash]).get(info_hash)
 
 def upgrade_torrent_title_from_metadata(torrent: Dict, metadata: Optional[dict]) -> bool:
     """Reconstrói title_processed quando metadata['name'] é mais completo que o título atual"""
@@ -2,6 +2,7 @@
 
 import html
 import re
+from functools import lru_cache
 from typing import Optional
 from urllib.parse import unquote
 
@@ -21,6 +22,7 @@ from utils.text.title_helpers import (
     _reorder_title_components,
 )
 
+@lru_cache(maxsize=4096)
 def _normalize_metadata_name(metadata_name: str) -> str:
     normalized = metadata_name.strip()
     normalized = html.unescape(normalized)
@@ -137,7 +139,8 @@ def prepare_release_title(
             if info_hash:
                 if not skip_metadata:
                     metadata_name = get_metadata_name(info_hash, skip_metadata=skip_metadata)
-                    if metadata_name and len(metadata_name.strip()) >= 3:
+                    # get_metadata_name já devolve o nome sem espaços nas pontas
+                    if metadata_name and len(metadata_name) >= 3:
                         original_release_title = _normalize_metadata_name(metadata_name)
                         final_missing_dn = False
                     else:
@@ -1,10 +1,21 @@
 # Copyright (c) 2025 DFlexy · https://github.com/DFlexy
 
 import re
-from typing import List
+from functools import lru_cache
+from typing import List, Pattern, Tuple
 
 from utils.text.cleaning import clean_title, remove_accents
 
+
+@lru_cache(maxsize=128)
+def _season_number_patterns(season_number_raw: str) -> Tuple[Pattern[str], Pattern[str]]:
+    """(Sxx já presente no título, SxxEyy a reduzir para Sxx) da temporada do release."""
+    season_number = season_number_raw.zfill(2)
+    return (
+        re.compile(rf'S0*{season_number_raw}(?:E\d+(?:-\d+)?|$)', re.IGNORECASE),
+        re.compile(rf'S{season_number}E\d+', re.IGNORECASE),
+    )
+
 def _extract_base_title_from_release(magnet_processed: str) -> str:
     clean_release = clean_title(magnet_processed)
     clean_release = remove_accents(clean_release)
@@ -272,11 +283,12 @@ def _apply_season_temporada_tags(title: str, magnet_processed: str, original_tit
             return result
         
         season_number = season_number_raw.zfill(2)
-        has_season_info = re.search(rf'S0*{season_number_raw}(?:E\d+(?:-\d+)?|$)', result, re.IGNORECASE)
+        season_info_re, season_ep_re = _season_number_patterns(season_number_raw)
+        has_season_info = season_info_re.search(result)
         has_any_season_ep = re.search(r'S\d{1,2}E\d{1,2}', result, re.IGNORECASE)
         
         if has_completo and has_any_season_ep:
-            result = re.sub(rf'S{season_number}E\d+', f'S{season_number}', result, flags=re.IGNORECASE)
+            result = season_ep_re.sub(f'S{season_number}', result)
             has_any_season_ep = False
         
         if not has_season_info and not has_any_season_ep: